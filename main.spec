@@ -26,6 +26,7 @@ a = Analysis(['src/space_warp/__main__.py'],
                  'space_warp.window_manager',
                  'space_warp.snapshot_manager',
                  'space_warp.main_window',
+                 'space_warp.system_tray',
                  'space_warp.permissions',
              ],
              hookspath=None,
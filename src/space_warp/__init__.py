@@ -2,18 +2,29 @@
 SpaceWarp - A revolutionary multi-display window and app layout manager for macOS
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "SpaceWarp Team"
 __description__ = (
     "A revolutionary multi-display window and app layout manager for macOS"
 )
 
-from .main import main
-from .config import Config
-from .window_manager import WindowManager, WindowInfo, DisplayInfo
-from .snapshot_manager import SnapshotManager, Snapshot
-from .main_window import MainWindow
-from .permissions import PermissionsHelper
+# Map public names to the submodules that define them. Submodules pull in
+# PyQt6, pyobjc and sqlite, so they are only imported on first attribute
+# access (PEP 562) instead of at package import time.
+_LAZY = {
+    "main": ".main",
+    "Config": ".config",
+    "WindowManager": ".window_manager",
+    "WindowInfo": ".window_manager",
+    "DisplayInfo": ".window_manager",
+    "SnapshotManager": ".snapshot_manager",
+    "Snapshot": ".snapshot_manager",
+    "MainWindow": ".main_window",
+    "SystemTrayIcon": ".system_tray",
+    "PermissionsHelper": ".permissions",
+}
 
 __all__ = [
     "main",
@@ -24,5 +35,21 @@ __all__ = [
     "SnapshotManager",
     "Snapshot",
     "MainWindow",
+    "SystemTrayIcon",
     "PermissionsHelper",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,58 +2,199 @@
 Configuration management for SpaceWarp
 """
 
-import yaml
+import atexit
+import copy
+import json
+import logging
+import mmap
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import yaml
+
+try:
+    # libyaml bindings are ~10x faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    # C-accelerated JSON when available; stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
+
+log = logging.getLogger(__name__)
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(config: dict[str, Any]) -> bytes:
+    if orjson:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode()
+
+
+# Resolve the config location once; the home lookup and mkdir syscall are
+# paid at module load rather than on every Config construction
+_CONFIG_DIR = Path.home() / ".spacewarp"
+_CONFIG_DIR.mkdir(exist_ok=True)
+_CONFIG_FILE = _CONFIG_DIR / "config.json"
+# Pre-JSON installs wrote YAML; read once for migration, then use JSON
+_LEGACY_CONFIG_FILE = _CONFIG_DIR / "config.yaml"
+_DATA_FILE = _CONFIG_DIR / "snapshots.db"
+
+# Canonical defaults, built once at import time. Treat as read-only;
+# code that needs a mutable view must deep-copy first.
+_DEFAULTS: dict[str, Any] = {
+    "start_minimized": False,
+    "auto_start": False,
+    "hotkeys": {
+        "save_snapshot": "Ctrl+Shift+S",
+        "restore_last_snapshot": "Ctrl+Shift+R",
+        "toggle_window_manager": "Ctrl+Shift+M",
+    },
+    "display": {
+        "auto_adjust_missing_displays": True,
+        "prompt_for_missing_displays": True,
+    },
+    "snapshots": {
+        "auto_save_interval": 300,  # 5 minutes
+        "max_snapshots": 50,
+    },
+    "ui": {
+        "style": "fusion",
+    },
+}
+
+_MISSING = object()
+
+
+def _diff_config(current: dict[str, Any], defaults: dict[str, Any]) -> dict[str, Any]:
+    """Return only the keys where current deviates from defaults
+
+    Nested dicts are diffed recursively; load_config reconstructs the full
+    view by merging the stored delta back over _DEFAULTS.
+    """
+    delta: dict[str, Any] = {}
+    for key, value in current.items():
+        base = defaults.get(key, _MISSING)
+        if isinstance(value, dict) and isinstance(base, dict):
+            sub = _diff_config(value, base)
+            if sub:
+                delta[key] = sub
+        elif base is _MISSING or value != base:
+            delta[key] = value
+    return delta
+
+
+# Split dot-notation keys once; get()/set() are called with the same
+# handful of key strings over and over
+_KEY_CACHE: dict[str, tuple[str, ...]] = {}
+
+
+def _split_key(key: str) -> tuple[str, ...]:
+    parts = _KEY_CACHE.get(key)
+    if parts is None:
+        parts = _KEY_CACHE.setdefault(key, tuple(key.split(".")))
+    return parts
+
+
+@lru_cache(maxsize=16)
+def _parse_config_cached(path: Path, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Parse the JSON config, cached on (path, mtime, size) so unchanged
+    files are only parsed once across repeated Config constructions."""
+    data = path.read_bytes()
+    if not data:
+        return None
+    return _json_loads(data)
+
+
+def _parse_legacy_yaml(path: Path) -> dict[str, Any] | None:
+    """One-time parse of a pre-migration YAML config."""
+    with open(path, "rb") as f:
+        try:
+            # Let the parser scan the mapped pages directly instead of
+            # going through Python-level read() calls
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=SafeLoader)
+        except ValueError:
+            # Zero-length files cannot be mapped; treat as empty config
+            return None
+
 
 class Config:
     """Configuration manager for the application"""
 
+    __slots__ = (
+        "config_dir",
+        "config_file",
+        "data_file",
+        "defaults",
+        "config",
+        "database_path",
+        "_dirty",
+        "_flush_scheduled",
+    )
+
     def __init__(self):
-        self.config_dir = Path.home() / ".spacewarp"
-        self.config_file = self.config_dir / "config.yaml"
-        self.data_file = self.config_dir / "snapshots.db"
-
-        # Ensure config directory exists
-        self.config_dir.mkdir(exist_ok=True)
-
-        # Default configuration
-        self.defaults = {
-            "start_minimized": False,
-            "auto_start": False,
-            "hotkeys": {
-                "save_snapshot": "Ctrl+Shift+S",
-                "restore_last_snapshot": "Ctrl+Shift+R",
-                "toggle_window_manager": "Ctrl+Shift+M",
-            },
-            "display": {
-                "auto_adjust_missing_displays": True,
-                "prompt_for_missing_displays": True,
-            },
-            "snapshots": {
-                "auto_save_interval": 300,  # 5 minutes
-                "max_snapshots": 50,
-            },
-        }
+        self.config_dir = _CONFIG_DIR
+        self.config_file = _CONFIG_FILE
+        self.data_file = _DATA_FILE
+        # Path to the SQLite database file (plain attribute; this is read
+        # on every SnapshotManager DB call)
+        self.database_path = self.data_file
+
+        # Default configuration (shared, read-only)
+        self.defaults = _DEFAULTS
 
         self.config = self.load_config()
 
+        # Write-coalescing state: set() only marks the config dirty and
+        # schedules a deferred flush instead of rewriting the file per key.
+        self._dirty = False
+        self._flush_scheduled = False
+        atexit.register(self.flush)
+
     def load_config(self) -> dict[str, Any]:
         """Load configuration from file or create default"""
         if self.config_file.exists():
             try:
-                with open(self.config_file) as f:
-                    config = yaml.safe_load(f)
-                    # Merge with defaults to ensure all keys exist
-                    return self._merge_config(self.defaults, config or {})
+                st = os.stat(self.config_file)
+                cached = _parse_config_cached(
+                    self.config_file, st.st_mtime_ns, st.st_size
+                )
+                config = copy.deepcopy(cached)
+                # Merge into a private copy of the defaults so set() can
+                # never mutate the shared _DEFAULTS tree
+                return self._merge_config(
+                    copy.deepcopy(_DEFAULTS), config or {}, inplace=True
+                )
+            except Exception as e:
+                log.warning("Error loading config: %s", e)
+                return copy.deepcopy(_DEFAULTS)
+        elif _LEGACY_CONFIG_FILE.exists():
+            # Migrate a pre-JSON install: parse the YAML once, persist as
+            # JSON and use JSON from then on
+            try:
+                legacy = _parse_legacy_yaml(_LEGACY_CONFIG_FILE)
+                merged = self._merge_config(
+                    copy.deepcopy(_DEFAULTS), legacy or {}, inplace=True
+                )
+                self.save_config(merged)
+                return merged
             except Exception as e:
-                print(f"Error loading config: {e}")
-                return self.defaults.copy()
+                log.warning("Error migrating legacy config: %s", e)
+                return copy.deepcopy(_DEFAULTS)
         else:
             # Create default config file
-            self.save_config(self.defaults)
-            return self.defaults.copy()
+            self.save_config(_DEFAULTS)
+            return copy.deepcopy(_DEFAULTS)
 
     def save_config(self, config: dict[str, Any] | None = None) -> None:
         """Save configuration to file"""
@@ -61,14 +202,21 @@ class Config:
             config = self.config
 
         try:
-            with open(self.config_file, "w") as f:
-                yaml.dump(config, f, default_flow_style=False)
+            # Persist only the delta against the defaults; serialize in
+            # memory, then swap the file in atomically so a crash
+            # mid-write can never leave a truncated config behind
+            payload = _json_dumps(_diff_config(config, _DEFAULTS))
+            tmp = self.config_file.with_suffix(".json.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, self.config_file)
+            # The on-disk file changed; drop stale parse-cache entries
+            _parse_config_cached.cache_clear()
         except Exception as e:
-            print(f"Error saving config: {e}")
+            log.warning("Error saving config: %s", e)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation"""
-        keys = key.split(".")
+        keys = _split_key(key)
         value = self.config
 
         for k in keys:
@@ -81,7 +229,7 @@ class Config:
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value using dot notation"""
-        keys = key.split(".")
+        keys = _split_key(key)
         config = self.config
 
         # Navigate to the parent of the target key
@@ -93,28 +241,70 @@ class Config:
         # Set the value
         config[keys[-1]] = value
 
-        # Save to file
-        self.save_config()
+        # Persist lazily so bursts of set() calls collapse into one write
+        self._dirty = True
+        self._schedule_flush()
+
+    def update(self, values: dict[str, Any]) -> None:
+        """Set many dot-notation keys with a single scheduled flush"""
+        for key, value in values.items():
+            keys = _split_key(key)
+            config = self.config
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            config[keys[-1]] = value
+        self._dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Schedule a deferred flush on the Qt event loop, or flush now
+        when no event loop is running."""
+        if self._flush_scheduled:
+            return
+        try:
+            from PyQt6.QtCore import QCoreApplication, QTimer
+
+            if QCoreApplication.instance() is not None:
+                self._flush_scheduled = True
+                QTimer.singleShot(250, self.flush)
+                return
+        except Exception:
+            pass
+        self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk immediately."""
+        self._flush_scheduled = False
+        if self._dirty:
+            self._dirty = False
+            self.save_config()
 
     def _merge_config(
-        self, defaults: dict[str, Any], user_config: dict[str, Any]
+        self,
+        defaults: dict[str, Any],
+        user_config: dict[str, Any],
+        inplace: bool = False,
     ) -> dict[str, Any]:
-        """Recursively merge user config with defaults"""
-        result = defaults.copy()
+        """Merge user config with defaults in O(user keys)
+
+        Copies at most one level per user-touched path; subtrees the user
+        never overrides are not traversed or re-allocated.
+        """
+        # Common first-run state: nothing to merge
+        if not user_config or user_config == defaults:
+            return defaults if inplace else defaults.copy()
+
+        result = defaults if inplace else {**defaults}
 
         for key, value in user_config.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = self._merge_config(result[key], value)
+            existing = result.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                if value:
+                    # Copy the subtree once, then merge into it in place
+                    result[key] = self._merge_config({**existing}, value, inplace=True)
             else:
                 result[key] = value
 
         return result
-
-    @property
-    def database_path(self) -> Path:
-        """Get the path to the SQLite database file"""
-        return self.data_file
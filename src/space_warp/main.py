@@ -3,15 +3,38 @@ SpaceWarp - A revolutionary multi-display window and app layout manager for macO
 """
 
 import sys
+from functools import cached_property
+
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QPalette
 
-from .main_window import MainWindow
-from .window_manager import WindowManager
-from .snapshot_manager import SnapshotManager
 from .config import Config
 
 
+class Services:
+    """Lazily constructed core components
+
+    WindowManager pulls in pyobjc/SkyLight and SnapshotManager opens the
+    SQLite database; building them on first access keeps them off the
+    startup critical path.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+
+    @cached_property
+    def window_manager(self):
+        from .window_manager import WindowManager
+
+        return WindowManager()
+
+    @cached_property
+    def snapshot_manager(self):
+        from .snapshot_manager import SnapshotManager
+
+        return SnapshotManager(self.config)
+
+
 def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
@@ -22,22 +45,50 @@ def main():
     app.setApplicationVersion("0.1.0")
     app.setOrganizationName("SpaceWarp")
 
-    # Apply Fusion style with light palette
-    app.setStyle("Fusion")
-    app.setPalette(app.style().standardPalette())
-
     # Initialize configuration
     config = Config()
+    services = Services(config)
+
+    # Apply the Fusion style with light palette off the critical path:
+    # style construction happens on the first event-loop iteration,
+    # overlapping with the first paint instead of delaying it
+    if config.get("ui.style", "fusion") == "fusion":
+
+        def _apply_style():
+            app.setStyle("Fusion")
+            app.setPalette(app.style().standardPalette())
+
+        QTimer.singleShot(0, _apply_style)
+
+    # Defer main window construction to the first event-loop iteration so
+    # the process reaches exec() without blocking on component init
+    holder = {}
+
+    def _bootstrap():
+        from PyQt6.QtWidgets import QSystemTrayIcon
+
+        from .main_window import MainWindow
 
-    # Initialize core components
-    window_manager = WindowManager()
-    snapshot_manager = SnapshotManager(config)
+        main_window = MainWindow(
+            services.window_manager, services.snapshot_manager, config
+        )
+        holder["main_window"] = main_window
+        if not config.get("start_minimized", False):
+            main_window.show()
 
-    # Create main window (initially hidden)
-    main_window = MainWindow(window_manager, snapshot_manager, config)
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            from .system_tray import SystemTrayIcon
 
+            tray = SystemTrayIcon(
+                services.window_manager,
+                services.snapshot_manager,
+                config,
+                main_window=main_window,
+            )
+            tray.show()
+            holder["tray"] = tray
 
-    main_window.show()
+    QTimer.singleShot(0, _bootstrap)
 
     return app.exec()
 
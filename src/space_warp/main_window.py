@@ -8,8 +8,7 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QTextEdit,
     QLineEdit,
     QLabel,
@@ -20,20 +19,67 @@ from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QDockWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QAbstractItemView,
+    QTableView,
+    QStyledItemDelegate,
     QHeaderView,
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QAction, QKeySequence, QFont
+from PyQt6.QtCore import (
+    Qt,
+    QTimer,
+    QAbstractListModel,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    QEvent,
+    QRect,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QAction, QKeySequence, QShortcut, QFont, QColor, QPainter
 from datetime import datetime
+from operator import attrgetter
+import io
 import json
 
+try:
+    # C-accelerated JSON when available; stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
 from .window_manager import WindowManager
 from .snapshot_manager import SnapshotManager
 from .config import Config
 from .permissions import PermissionsHelper
 
+# Fields the periodic refresh reads per window; a compiled attrgetter
+# pulls all five in one call
+_WINDOW_LIST_FIELDS = attrgetter(
+    "app_name", "window_title", "display_id", "is_minimized", "is_hidden"
+)
+
+# Window-list poll rates: fast while the window has focus, slow while it
+# is visible but in the background (the poll stops entirely when hidden)
+REFRESH_INTERVAL_MS = 2000
+REFRESH_IDLE_INTERVAL_MS = 10000
+
+# Status suffixes for window-list rows, interned once
+_STATUS_MINIMIZED = " [Minimized]"
+_STATUS_HIDDEN = " [Hidden]"
+
+
+def _auto_timestamp() -> str:
+    """YYYYmmdd_HHMMSS from datetime attributes; skips the strftime
+    format parser on the hotkey-repeatable capture path"""
+    now = datetime.now()
+    return (
+        f"{now.year:04d}{now.month:02d}{now.day:02d}"
+        f"_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    )
+
 
 class SnapshotDialog(QDialog):
     """Dialog for creating/editing snapshots"""
@@ -72,6 +118,12 @@ class SnapshotDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    def reset_fields(self, snapshot_name="", description=""):
+        """Prepare a reused instance for another exec()"""
+        self.name_edit.setText(snapshot_name)
+        self.description_edit.setPlainText(description)
+        self.name_edit.setFocus()
+
     def get_data(self):
         return (
             self.name_edit.text().strip(),
@@ -79,6 +131,215 @@ class SnapshotDialog(QDialog):
         )
 
 
+class SimpleListModel(QAbstractListModel):
+    """List model over Python objects with precomputed display texts
+
+    Refreshes are a single model reset instead of per-item widget
+    allocations; only visible rows are queried during paint.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._texts = []
+
+    def set_rows(self, rows, texts):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._texts = list(texts)
+        self.endResetModel()
+
+    def row(self, i):
+        return self._rows[i]
+
+    def rows(self):
+        return self._rows
+
+    def insert_row(self, i, row, text):
+        self.beginInsertRows(QModelIndex(), i, i)
+        self._rows.insert(i, row)
+        self._texts.insert(i, text)
+        self.endInsertRows()
+
+    def move_row(self, src, dst):
+        if src == dst:
+            return
+        # Qt counts the destination in pre-move rows: it is the row the
+        # item will sit before once moved
+        if not self.beginMoveRows(
+            QModelIndex(), src, src, QModelIndex(), dst if dst < src else dst + 1
+        ):
+            return
+        self._rows.insert(dst, self._rows.pop(src))
+        self._texts.insert(dst, self._texts.pop(src))
+        self.endMoveRows()
+
+    def update_row(self, i, row, text):
+        self._rows[i] = row
+        self._texts[i] = text
+        index = self.index(i)
+        self.dataChanged.emit(index, index)
+
+    def remove_row(self, i):
+        self.beginRemoveRows(QModelIndex(), i, i)
+        del self._rows[i]
+        del self._texts[i]
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()]
+        return None
+
+
+class SnapshotWindowsModel(QAbstractTableModel):
+    """Table model over a snapshot's windows list
+
+    Holds the windows by reference and resolves cell values lazily in
+    data(), so selecting a large snapshot costs one model reset instead
+    of N*13 item allocations.
+    """
+
+    COLUMNS = [
+        "",
+        "App",
+        "Title",
+        "X",
+        "Y",
+        "Width",
+        "Height",
+        "Minimized",
+        "Hidden",
+        "Display",
+        "PID",
+        "Space",
+        "WinID",
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._windows = []
+        self._display_map = {}
+
+    def set_snapshot(self, windows, display_map):
+        self.beginResetModel()
+        self._windows = windows
+        self._display_map = display_map
+        self.endResetModel()
+
+    def window_at(self, row):
+        return self._windows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._windows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        w = self._windows[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return w
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        col = index.column()
+        if col == 1:
+            return w.app_name
+        if col == 2:
+            return w.window_title
+        if col == 3:
+            return w.x
+        if col == 4:
+            return w.y
+        if col == 5:
+            return w.width
+        if col == 6:
+            return w.height
+        if col == 7:
+            return "Yes" if w.is_minimized else "No"
+        if col == 8:
+            return "Yes" if w.is_hidden else "No"
+        if col == 9:
+            return self._display_map.get(w.display_id, "?")
+        if col == 10:
+            return w.pid
+        if col == 11:
+            return getattr(w, "space_id", None)
+        if col == 12:
+            return getattr(w, "window_id", None)
+        return None
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """Paints the per-row delete button instead of allocating widgets"""
+
+    removeRequested = pyqtSignal(int)  # view (proxy) row
+
+    def _button_rect(self, cell_rect: QRect) -> QRect:
+        rect = QRect(0, 0, 24, 24)
+        rect.moveCenter(cell_rect.center())
+        return rect
+
+    def paint(self, painter, option, index):
+        rect = self._button_rect(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#b71c1c"))
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setPen(QColor("white"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "✕")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and self._button_rect(
+            option.rect
+        ).contains(event.position().toPoint()):
+            self.removeRequested.emit(index.row())
+            return True
+        return False
+
+
+class _WindowSnapshotSignals(QObject):
+    """Signal carrier for WindowSnapshotTask (QRunnable can't emit)"""
+
+    finished = pyqtSignal(object, object)  # windows, displays
+
+
+class WindowSnapshotTask(QRunnable):
+    """Fetches the window/display lists off the GUI thread"""
+
+    def __init__(self, window_manager, signals: _WindowSnapshotSignals):
+        super().__init__()
+        self.window_manager = window_manager
+        self.signals = signals
+
+    def run(self):
+        try:
+            windows = self.window_manager.get_windows()
+            displays = self.window_manager.get_displays()
+        except Exception:
+            windows, displays = [], []
+        self.signals.finished.emit(windows, displays)
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
 
@@ -102,17 +363,49 @@ class MainWindow(QMainWindow):
         self.setup_status_bar()
         self.setup_shortcuts()
 
-        # Check permissions on startup
-        self.check_permissions()
-
-        # Update timer
+        # Check permissions once the event loop is pumping; the TCC lookup
+        # can be slow on cold boot and must not delay the first paint
+        QTimer.singleShot(0, self.check_permissions)
+
+        # Change detection for the periodic refresh: most ticks nothing
+        # moved, so the list widgets are left untouched
+        self._window_list_signature = None
+        self._debug_info_text = None
+
+        # Background fetch of the window list; _refresh_inflight coalesces
+        # timer ticks that arrive while a fetch is still running
+        self._pool = QThreadPool.globalInstance()
+        self._snapshot_signals = _WindowSnapshotSignals(self)
+        self._snapshot_signals.finished.connect(self._apply_window_list)
+        self._refresh_inflight = False
+
+        # Serialized-snapshot cache for the raw JSON viewer
+        self._json_cache: dict[tuple, str] = {}
+
+        # name -> model row, kept in sync by load/save/delete handlers
+        self._snapshot_row_by_name: dict[str, int] = {}
+
+        # Lazily built, reused save dialog
+        self._snapshot_dialog = None
+
+        # Debug-log lines are buffered and flushed on a 100ms tick so a
+        # burst restore does one append per tick instead of per signal
+        self._log_buffer: list[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start()
+
+        # Update timer; the interval is activation-aware (see
+        # _refresh_interval) and it only runs while the window is
+        # visible — showEvent starts it, so a start-minimized launch
+        # never polls for an invisible UI
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_window_list)
-        self.update_timer.start(2000)  # Update every 2 seconds
 
-        # Load initial data
-        self.load_snapshots()
-        self.update_window_list()
+        # Load initial data after the empty UI has painted; the window
+        # list itself fills on first show
+        QTimer.singleShot(0, self.load_snapshots)
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -144,12 +437,14 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(group)
 
         # Window list
-        self.window_list = QListWidget()
+        self.window_model = SimpleListModel(self)
+        self.window_list = QListView()
+        self.window_list.setModel(self.window_model)
         f1 = QFont()
         f1.setPointSize(16)
         self.window_list.setFont(f1)
-        self.window_list.setStyleSheet("QListWidget { font-size: 16px; } QListWidget::item { padding: 6px 4px; }")
-        self.window_list.itemSelectionChanged.connect(self.on_window_selected)
+        self.window_list.setStyleSheet("QListView { font-size: 16px; } QListView::item { padding: 6px 4px; }")
+        self.window_list.selectionModel().selectionChanged.connect(self.on_window_selected)
         layout.addWidget(self.window_list)
 
         # Control buttons
@@ -177,13 +472,15 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(group)
 
         # Snapshot list
-        self.snapshot_list = QListWidget()
+        self.snapshot_model = SimpleListModel(self)
+        self.snapshot_list = QListView()
+        self.snapshot_list.setModel(self.snapshot_model)
         f2 = QFont()
         f2.setPointSize(16)
         self.snapshot_list.setFont(f2)
-        self.snapshot_list.setStyleSheet("QListWidget { font-size: 16px; } QListWidget::item { padding: 6px 4px; }")
-        self.snapshot_list.itemSelectionChanged.connect(self.on_snapshot_selected)
-        self.snapshot_list.itemDoubleClicked.connect(self.restore_selected_snapshot)
+        self.snapshot_list.setStyleSheet("QListView { font-size: 16px; } QListView::item { padding: 6px 4px; }")
+        self.snapshot_list.selectionModel().currentChanged.connect(self.on_snapshot_selected)
+        self.snapshot_list.doubleClicked.connect(self.restore_selected_snapshot)
         layout.addWidget(self.snapshot_list)
 
         # Snapshot info
@@ -192,29 +489,28 @@ class MainWindow(QMainWindow):
         self.snapshot_info.setReadOnly(True)
         layout.addWidget(self.snapshot_info)
 
-        self.snapshot_windows_table = QTableWidget()
-        self.snapshot_windows_table.setColumnCount(13)
-        self.snapshot_windows_table.setHorizontalHeaderLabels([
-            "",
-            "App",
-            "Title",
-            "X",
-            "Y",
-            "Width",
-            "Height",
-            "Minimized",
-            "Hidden",
-            "Display",
-            "PID",
-            "Space",
-            "WinID",
-        ])
-        self.snapshot_windows_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.snapshot_windows_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.snapshot_windows_model = SnapshotWindowsModel(self)
+        self.snapshot_windows_proxy = QSortFilterProxyModel(self)
+        self.snapshot_windows_proxy.setSourceModel(self.snapshot_windows_model)
+        self.snapshot_windows_table = QTableView()
+        self.snapshot_windows_table.setModel(self.snapshot_windows_proxy)
+        self.snapshot_windows_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.snapshot_windows_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.snapshot_windows_table.setAlternatingRowColors(True)
         self.snapshot_windows_table.setSortingEnabled(True)
-        self.snapshot_windows_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        # Fixed widths chosen from column semantics; content-based sizing
+        # would stringify every cell just to lay out the header
+        hdr = self.snapshot_windows_table.horizontalHeader()
+        hdr.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        for col, width in enumerate(
+            [40, 140, 280, 60, 60, 60, 60, 80, 70, 120, 70, 70, 70]
+        ):
+            self.snapshot_windows_table.setColumnWidth(col, width)
         self.snapshot_windows_table.verticalHeader().setVisible(False)
+        self.snapshot_windows_table.verticalHeader().setDefaultSectionSize(28)
+        self._delete_delegate = DeleteButtonDelegate(self.snapshot_windows_table)
+        self._delete_delegate.removeRequested.connect(self._on_snapshot_row_delete)
+        self.snapshot_windows_table.setItemDelegateForColumn(0, self._delete_delegate)
         layout.addWidget(self.snapshot_windows_table)
 
         # Control buttons
@@ -244,74 +540,52 @@ class MainWindow(QMainWindow):
 
         return group
 
-    def create_debug_panel(self):
-        group = QGroupBox("Debug")
-        layout = QVBoxLayout(group)
+    def setup_logging_connections(self):
+        # Bound methods as slots: emitted many times per restore, and a
+        # bound method avoids the per-emit closure frame a lambda carries
+        try:
+            self.window_manager.window_restore_started.connect(self._on_restore_started)
+            self.window_manager.window_restored.connect(self._on_window_restored)
+            self.window_manager.window_restore_failed.connect(self._on_restore_failed)
+            self.window_manager.window_launch_attempt.connect(self._on_launch_attempt)
+            self.window_manager.window_launch_result.connect(self._on_launch_result)
+            self.snapshot_manager.snapshot_restored.connect(self._on_snapshot_restored)
+            self.snapshot_manager.snapshot_saved.connect(self._on_snapshot_saved)
+            self.snapshot_manager.snapshot_deleted.connect(self._on_snapshot_deleted)
+        except Exception:
+            pass
 
-        info_group = QGroupBox("Display & Window Coordinates")
-        info_layout = QVBoxLayout(info_group)
-        self.debug_info = QTextEdit()
-        self.debug_info.setReadOnly(True)
-        self.debug_info.setMinimumHeight(200)
-        info_layout.addWidget(self.debug_info)
-        layout.addWidget(info_group)
+    def _on_restore_started(self, app, title):
+        self.append_debug_log(f"START {app} | {title}")
 
-        log_group = QGroupBox("Restore Log")
-        log_layout = QVBoxLayout(log_group)
-        self.debug_log = QTextEdit()
-        self.debug_log.setReadOnly(True)
-        self.debug_log.setMinimumHeight(160)
-        log_layout.addWidget(self.debug_log)
-        layout.addWidget(log_group)
+    def _on_window_restored(self, app, title):
+        self.append_debug_log(f"OK    {app} | {title}")
 
-        button_layout = QHBoxLayout()
-        self.debug_refresh_btn = QPushButton("Refresh Debug Info")
-        self.debug_refresh_btn.clicked.connect(self.update_window_list)
-        button_layout.addWidget(self.debug_refresh_btn)
-        layout.addLayout(button_layout)
+    def _on_restore_failed(self, app, title, reason):
+        self.append_debug_log(f"FAIL  {app} | {title} reason={reason}")
 
-        return group
+    def _on_launch_attempt(self, app, cmd):
+        self.append_debug_log(f"LAUNCH TRY {app} cmd={cmd}")
 
-    def setup_logging_connections(self):
-        try:
-            self.window_manager.window_restore_started.connect(
-                lambda app, title: self.append_debug_log(f"START {app} | {title}")
-            )
-            self.window_manager.window_restored.connect(
-                lambda app, title: self.append_debug_log(f"OK    {app} | {title}")
-            )
-            self.window_manager.window_restore_failed.connect(
-                lambda app, title, reason: self.append_debug_log(
-                    f"FAIL  {app} | {title} reason={reason}"
-                )
-            )
-            self.window_manager.window_launch_attempt.connect(
-                lambda app, cmd: self.append_debug_log(f"LAUNCH TRY {app} cmd={cmd}")
-            )
-            self.window_manager.window_launch_result.connect(
-                lambda app, ok, detail: self.append_debug_log(
-                    f"LAUNCH {'OK' if ok else 'FAIL'} {app} detail={detail}"
-                )
-            )
-            self.snapshot_manager.snapshot_restored.connect(
-                lambda name: self.append_debug_log(f"SNAPSHOT OK {name}")
-            )
-            self.snapshot_manager.snapshot_saved.connect(
-                lambda name: (self.load_snapshots(), self.select_snapshot_by_name(name))
-            )
-            self.snapshot_manager.snapshot_deleted.connect(
-                lambda name: self.load_snapshots()
-            )
-        except Exception:
-            pass
+    def _on_launch_result(self, app, ok, detail):
+        self.append_debug_log(f"LAUNCH {'OK' if ok else 'FAIL'} {app} detail={detail}")
+
+    def _on_snapshot_restored(self, name):
+        self.append_debug_log(f"SNAPSHOT OK {name}")
 
     def append_debug_log(self, line: str):
         try:
             ts = datetime.now().strftime("%H:%M:%S")
-            self.debug_log.append(f"[{ts}] {line}")
+            self._log_buffer.append(f"[{ts}] {line}")
         except Exception:
             pass
 
+    def _flush_log(self):
+        """Flush buffered log lines in one append (one layout pass)"""
+        if self._log_buffer:
+            self.debug_log.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
     def setup_menu_bar(self):
         """Setup the menu bar"""
         menubar = self.menuBar()
@@ -338,8 +612,7 @@ class MainWindow(QMainWindow):
         refresh_action.setShortcut(QKeySequence.StandardKey.Refresh)
         refresh_action.triggered.connect(self.update_window_list)
         view_menu.addAction(refresh_action)
-        if hasattr(self, "debug_dock"):
-            view_menu.addAction(self.debug_dock.toggleViewAction())
+        view_menu.addAction(self.debug_dock.toggleViewAction())
 
         # Tools menu
         tools_menu = menubar.addMenu("Tools")
@@ -365,6 +638,10 @@ class MainWindow(QMainWindow):
         self.debug_log = QTextEdit()
         self.debug_log.setReadOnly(True)
         self.debug_log.setMinimumHeight(160)
+        # Cap the log so appends stay O(1) over long sessions; Qt drops
+        # the oldest blocks automatically
+        self.debug_log.document().setMaximumBlockCount(2000)
+        self.debug_log.setUndoRedoEnabled(False)
         log_layout.addWidget(self.debug_log)
         layout.addWidget(log_group)
         button_layout = QHBoxLayout()
@@ -381,7 +658,16 @@ class MainWindow(QMainWindow):
         """Setup the status bar"""
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready")
+        self._last_status = ""
+        self._set_status("Ready")
+
+    def _set_status(self, msg: str):
+        """showMessage repaints even for an identical message; skip the
+        call when nothing changed (the refresh loop re-reports the same
+        counts every tick)"""
+        if msg != self._last_status:
+            self._last_status = msg
+            self.status_bar.showMessage(msg)
 
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -392,49 +678,77 @@ class MainWindow(QMainWindow):
             ("Ctrl+Shift+M", self.show_window_manager),
         ]
 
+        # QShortcut is lighter than a QAction per binding: no trigger
+        # cascade and one fewer QObject each
         for shortcut, callback in shortcuts:
-            action = QAction(self)
-            action.setShortcut(QKeySequence(shortcut))
-            action.triggered.connect(callback)
-            self.addAction(action)
+            QShortcut(QKeySequence(shortcut), self, activated=callback)
+
+    def showEvent(self, event):
+        """Resume refreshing when the window becomes visible"""
+        super().showEvent(event)
+        if not self.update_timer.isActive():
+            self.update_timer.start(self._refresh_interval())
+            # Refresh right away so the list isn't a full interval stale
+            # (or empty, on the very first show)
+            QTimer.singleShot(0, self.update_window_list)
+
+    def hideEvent(self, event):
+        """No point polling the window list while the UI is invisible"""
+        super().hideEvent(event)
+        self.update_timer.stop()
+
+    def _refresh_interval(self) -> int:
+        """Fast refresh while the user is looking at the window, slow
+        fallback while it is merely visible in the background"""
+        return (
+            REFRESH_INTERVAL_MS if self.isActiveWindow() else REFRESH_IDLE_INTERVAL_MS
+        )
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self.update_timer.stop()
+            elif self.isVisible() and not self.update_timer.isActive():
+                self.update_timer.start(self._refresh_interval())
+        elif event.type() == QEvent.Type.ActivationChange:
+            if self.isVisible() and not self.isMinimized():
+                if self.isActiveWindow():
+                    # Catch up immediately, then poll at the fast rate
+                    self.update_window_list()
+                self.update_timer.start(self._refresh_interval())
 
     def update_window_list(self):
-        """Update the current windows list"""
-        self.window_list.clear()
+        """Kick off a background refresh of the current windows list"""
+        if self._refresh_inflight:
+            return
+        self._refresh_inflight = True
+        self._pool.start(WindowSnapshotTask(self.window_manager, self._snapshot_signals))
+
+    def _refresh_now(self):
+        """Explicit refresh that pushes the next scheduled tick out by a
+        full interval, so an action-triggered refresh and the poll timer
+        don't fire back to back"""
+        if self.update_timer.isActive():
+            self.update_timer.start(self.update_timer.interval())
+        self.update_window_list()
 
+    def _apply_window_list(self, windows, displays):
+        """Apply a fetched window/display list to the UI (GUI thread)"""
+        self._refresh_inflight = False
         try:
-            windows = self.window_manager.get_windows()
-            displays = self.window_manager.get_displays()
-
-            for window in windows:
-                # Create display info string
-                display_info = ""
-                for display in displays:
-                    if display.display_id == window.display_id:
-                        display_info = f" - {display.name}"
-                        break
-
-                # Create window item
-                status = ""
-                if window.is_minimized:
-                    status = " [Minimized]"
-                elif window.is_hidden:
-                    status = " [Hidden]"
-
-                item_text = (
-                    f"{window.app_name}: {window.window_title}{status}{display_info}"
-                )
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, window)
-                self.window_list.addItem(item)
+            signature = tuple(map(_WINDOW_LIST_FIELDS, windows))
+            if signature != self._window_list_signature:
+                self._window_list_signature = signature
+                self._apply_window_list_items(windows, displays)
 
             # Show permission status in status bar
             if not self.window_manager._permissions_granted:
-                self.status_bar.showMessage(
+                self._set_status(
                     "⚠️ Permissions required - check Help menu for instructions"
                 )
             else:
-                self.status_bar.showMessage(
+                self._set_status(
                     f"Found {len(windows)} windows on {len(displays)} displays"
                 )
 
@@ -453,36 +767,101 @@ class MainWindow(QMainWindow):
                     lines.append(
                         f"- {w.app_name} | {w.window_title} pid={w.pid} x={w.x} y={w.y} w={w.width} h={w.height} display_id={w.display_id} space_id={sid if sid is not None else ''} window_id={wid if wid is not None else ''}"
                     )
-                if hasattr(self, "debug_info"):
-                    self.debug_info.setPlainText("\n".join(lines))
+                text = "\n".join(lines)
+                if text != self._debug_info_text:
+                    self._debug_info_text = text
+                    self.debug_info.setPlainText(text)
             except Exception as _:
                 pass
 
         except Exception as e:
-            self.status_bar.showMessage(f"Error updating window list: {e}")
+            self._set_status(f"Error updating window list: {e}")
+
+    def _apply_window_list_items(self, windows, displays):
+        """Push a changed window list into the model (single reset)"""
+        display_name_by_id = {d.display_id: d.name for d in displays}
+        texts = []
+        # One compiled attrgetter call per window instead of five
+        # attribute lookups in the hot 2s-refresh loop
+        for app_name, title, display_id, minimized, hidden in map(
+            _WINDOW_LIST_FIELDS, windows
+        ):
+            name = display_name_by_id.get(display_id)
+            display_info = f" - {name}" if name else ""
+
+            status = (
+                _STATUS_MINIMIZED
+                if minimized
+                else (_STATUS_HIDDEN if hidden else "")
+            )
+
+            texts.append(f"{app_name}: {title}{status}{display_info}")
+        self.window_model.set_rows(windows, texts)
 
     def load_snapshots(self):
         """Load saved snapshots"""
-        self.snapshot_list.clear()
+        self._json_cache.clear()
 
         try:
             snapshots = self.snapshot_manager.get_all_snapshots()
-            for snapshot in snapshots:
-                item = QListWidgetItem(snapshot.name)
-                item.setData(Qt.ItemDataRole.UserRole, snapshot)
-                self.snapshot_list.addItem(item)
+            self.snapshot_model.set_rows(snapshots, [s.name for s in snapshots])
+            self._rebuild_snapshot_index()
 
-            self.status_bar.showMessage(f"Loaded {len(snapshots)} snapshots")
+            self._set_status(f"Loaded {len(snapshots)} snapshots")
 
         except Exception as e:
-            self.status_bar.showMessage(f"Error loading snapshots: {e}")
+            self._set_status(f"Error loading snapshots: {e}")
+
+    def _on_snapshot_saved(self, name: str):
+        """Update or append a single snapshot row instead of reloading all"""
+        for key in [k for k in self._json_cache if k[0] == name]:
+            self._json_cache.pop(key, None)
+        try:
+            snapshot = self.snapshot_manager.get_snapshot(name)
+        except Exception:
+            snapshot = None
+        if snapshot is None:
+            self.load_snapshots()
+            return
+        # load_snapshots orders created_at DESC, and a save (new or
+        # re-saved via the UPSERT) always bumps created_at — so the
+        # freshly saved row belongs at the top, exactly where a full
+        # reload would put it
+        row = self._snapshot_row_by_name.get(name)
+        if row is not None:
+            self.snapshot_model.update_row(row, snapshot, name)
+            self.snapshot_model.move_row(row, 0)
+        else:
+            self.snapshot_model.insert_row(0, snapshot, name)
+        self._rebuild_snapshot_index()
+        self.snapshot_list.setCurrentIndex(self.snapshot_model.index(0))
+        self.on_snapshot_selected()
+
+    def _on_snapshot_deleted(self, name: str):
+        """Remove a single snapshot row instead of reloading all"""
+        for key in [k for k in self._json_cache if k[0] == name]:
+            self._json_cache.pop(key, None)
+        row = self._snapshot_row_by_name.get(name)
+        if row is not None:
+            self.snapshot_model.remove_row(row)
+            self._rebuild_snapshot_index()
+
+    def _rebuild_snapshot_index(self):
+        self._snapshot_row_by_name = {
+            s.name: i for i, s in enumerate(self.snapshot_model.rows())
+        }
 
     def select_snapshot_by_name(self, name: str):
-        for i in range(self.snapshot_list.count()):
-            it = self.snapshot_list.item(i)
-            if it and it.text() == name:
-                self.snapshot_list.setCurrentItem(it)
-                break
+        row = self._snapshot_row_by_name.get(name)
+        if row is not None:
+            self.snapshot_list.setCurrentIndex(self.snapshot_model.index(row))
+
+    def _current_snapshot(self):
+        """Snapshot object behind the current list selection, or None"""
+        index = self.snapshot_list.currentIndex()
+        if index.isValid():
+            return self.snapshot_model.row(index.row())
+        return None
 
     def on_window_selected(self):
         """Handle window selection"""
@@ -490,99 +869,101 @@ class MainWindow(QMainWindow):
 
     def on_snapshot_selected(self):
         """Handle snapshot selection"""
-        current_item = self.snapshot_list.currentItem()
-        if current_item:
-            snapshot = current_item.data(Qt.ItemDataRole.UserRole)
-            if snapshot:
-                lines = []
-                lines.append(f"Name: {snapshot.name}")
-                lines.append(
-                    f"Created: {snapshot.created_at.strftime('%Y-%m-%d %H:%M:%S')}"
-                )
-                lines.append(f"Description: {snapshot.description}")
-                lines.append("")
-
-                lines.append(f"Displays ({len(snapshot.displays)}):")
-                for d in snapshot.displays:
-                    lines.append(
-                        f"- {d.name} id={d.display_id} main={d.is_main} x={d.x} y={d.y} w={d.width} h={d.height}"
-                    )
-
+        snapshot = self._current_snapshot()
+        if snapshot:
+            # Snapshots are immutable once loaded; render the info block
+            # once and keep it on the snapshot for repeat selections
+            info_text = getattr(snapshot, "_info_text", None)
+            if info_text is None:
+                info_text = snapshot._info_text = self._render_snapshot_info(snapshot)
+
+            display_name_map = getattr(snapshot, "_display_name_map", None)
+            if display_name_map is None:
                 display_name_map = {d.display_id: d.name for d in snapshot.displays}
+                snapshot._display_name_map = display_name_map
 
-                if snapshot.metadata:
-                    lines.append("")
-                    lines.append("Metadata:")
-                    for k, v in snapshot.metadata.items():
-                        lines.append(f"- {k}: {v}")
-
-                self.snapshot_info.setPlainText("\n".join(lines))
-
-                self.snapshot_windows_table.setRowCount(len(snapshot.windows))
-                self.snapshot_windows_table.setColumnCount(13)
-                self.snapshot_windows_table.setHorizontalHeaderLabels([
-                    "",
-                    "App",
-                    "Title",
-                    "X",
-                    "Y",
-                    "Width",
-                    "Height",
-                    "Minimized",
-                    "Hidden",
-                    "Display",
-                    "PID",
-                    "Space",
-                    "WinID",
-                ])
-                for i, w in enumerate(snapshot.windows):
-                    disp_name = display_name_map.get(w.display_id, "?")
-                    btn = QPushButton("✕")
-                    btn.setFixedSize(24, 24)
-                    btn.setStyleSheet(
-                        "QPushButton { background-color: #b71c1c; color: white; border: none; border-radius: 4px; }"
-                        "QPushButton:hover { background-color: #8b0000; }"
-                    )
-                    btn.clicked.connect(lambda _, a=w.app_name, s=snapshot.name: self._remove_app_from_snapshot_row(s, a))
-                    container = QWidget()
-                    lay = QHBoxLayout(container)
-                    lay.setContentsMargins(0, 0, 0, 0)
-                    lay.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    lay.addWidget(btn)
-                    self.snapshot_windows_table.setCellWidget(i, 0, container)
-                    self.snapshot_windows_table.setRowHeight(i, 28)
-                    self.snapshot_windows_table.setItem(i, 1, QTableWidgetItem(str(w.app_name)))
-                    self.snapshot_windows_table.setItem(i, 2, QTableWidgetItem(str(w.window_title)))
-                    self.snapshot_windows_table.setItem(i, 3, QTableWidgetItem(str(w.x)))
-                    self.snapshot_windows_table.setItem(i, 4, QTableWidgetItem(str(w.y)))
-                    self.snapshot_windows_table.setItem(i, 5, QTableWidgetItem(str(w.width)))
-                    self.snapshot_windows_table.setItem(i, 6, QTableWidgetItem(str(w.height)))
-                    self.snapshot_windows_table.setItem(i, 7, QTableWidgetItem("Yes" if w.is_minimized else "No"))
-                    self.snapshot_windows_table.setItem(i, 8, QTableWidgetItem("Yes" if w.is_hidden else "No"))
-                    self.snapshot_windows_table.setItem(i, 9, QTableWidgetItem(str(disp_name)))
-                    self.snapshot_windows_table.setItem(i, 10, QTableWidgetItem(str(w.pid)))
-                    self.snapshot_windows_table.setItem(i, 11, QTableWidgetItem(str(w.space_id if getattr(w, "space_id", None) is not None else "")))
-                    self.snapshot_windows_table.setItem(i, 12, QTableWidgetItem(str(w.window_id if getattr(w, "window_id", None) is not None else "")))
-                self.snapshot_windows_table.setColumnWidth(0, 40)
-            else:
-                self.snapshot_windows_table.setRowCount(0)
+            self.snapshot_info.setPlainText(info_text)
+
+            self._current_snapshot_name = snapshot.name
+            self.snapshot_windows_model.set_snapshot(
+                snapshot.windows, display_name_map
+            )
         else:
-            self.snapshot_windows_table.setRowCount(0)
+            self.snapshot_windows_model.set_snapshot([], {})
+
+    @staticmethod
+    def _render_snapshot_info(snapshot) -> str:
+        """Build the snapshot-info text block shown on selection"""
+        lines = []
+        lines.append(f"Name: {snapshot.name}")
+        lines.append(f"Created: {snapshot.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Description: {snapshot.description}")
+        lines.append("")
+
+        lines.append(f"Displays ({len(snapshot.displays)}):")
+        for d in snapshot.displays:
+            lines.append(
+                f"- {d.name} id={d.display_id} main={d.is_main} x={d.x} y={d.y} w={d.width} h={d.height}"
+            )
 
-    def view_raw_json(self):
-        current_item = self.snapshot_list.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Warning", "Please select a snapshot.")
+        if snapshot.metadata:
+            lines.append("")
+            lines.append("Metadata:")
+            for k, v in snapshot.metadata.items():
+                lines.append(f"- {k}: {v}")
+
+        return "\n".join(lines)
+
+    def _on_snapshot_row_delete(self, proxy_row: int):
+        """Handle a click on the delete delegate in the windows table"""
+        source_index = self.snapshot_windows_proxy.mapToSource(
+            self.snapshot_windows_proxy.index(proxy_row, 0)
+        )
+        if not source_index.isValid():
             return
+        window = self.snapshot_windows_model.window_at(source_index.row())
+        snapshot_name = getattr(self, "_current_snapshot_name", None)
+        if snapshot_name:
+            self._remove_app_from_snapshot_row(snapshot_name, window.app_name)
 
-        snapshot = current_item.data(Qt.ItemDataRole.UserRole)
+    def view_raw_json(self):
+        snapshot = self._current_snapshot()
         if not snapshot:
+            QMessageBox.warning(self, "Warning", "Please select a snapshot.")
             return
 
+        cache_key = (snapshot.name, snapshot.created_at)
+        text = self._json_cache.get(cache_key)
+        if text is None:
+            text = self._serialize_snapshot_json(snapshot)
+            self._json_cache[cache_key] = text
+
+        dlg = QDialog(self)
+        dlg.setWindowTitle(f"Snapshot JSON: {snapshot.name}")
+        dlg.resize(700, 500)
+
+        v = QVBoxLayout(dlg)
+        te = QTextEdit()
+        te.setReadOnly(True)
+        te.setPlainText(text)
+        v.addWidget(te)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok,
+            Qt.Orientation.Horizontal,
+            dlg,
+        )
+        buttons.accepted.connect(dlg.accept)
+        v.addWidget(buttons)
+
+        dlg.exec()
+
+    def _serialize_snapshot_json(self, snapshot) -> str:
+        """Build the pretty-printed JSON text for a snapshot"""
         payload = {
             "name": snapshot.name,
             "description": snapshot.description,
-            "created_at": snapshot.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "created_at": snapshot.created_at,
             "windows": [
                 {
                     "app_name": w.app_name,
@@ -615,27 +996,16 @@ class MainWindow(QMainWindow):
             "metadata": snapshot.metadata or {},
         }
 
-        text = json.dumps(payload, indent=2)
+        if orjson:
+            return orjson.dumps(
+                payload, default=str, option=orjson.OPT_INDENT_2
+            ).decode()
 
-        dlg = QDialog(self)
-        dlg.setWindowTitle(f"Snapshot JSON: {snapshot.name}")
-        dlg.resize(700, 500)
-
-        v = QVBoxLayout(dlg)
-        te = QTextEdit()
-        te.setReadOnly(True)
-        te.setPlainText(text)
-        v.addWidget(te)
-
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok,
-            Qt.Orientation.Horizontal,
-            dlg,
-        )
-        buttons.accepted.connect(dlg.accept)
-        v.addWidget(buttons)
-
-        dlg.exec()
+        # Serialize straight into a buffer instead of building one big
+        # intermediate string
+        buf = io.StringIO()
+        json.dump(payload, buf, indent=2, default=str)
+        return buf.getvalue()
 
     def capture_all_windows(self):
         """Capture all current windows"""
@@ -644,7 +1014,7 @@ class MainWindow(QMainWindow):
             displays = self.window_manager.get_displays()
 
             # Auto-generate name
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _auto_timestamp()
             name = f"Auto_{timestamp}"
             description = f"Auto-captured layout with {len(windows)} windows"
 
@@ -654,37 +1024,36 @@ class MainWindow(QMainWindow):
             )
 
             if success:
-                self.load_snapshots()
-                self.status_bar.showMessage(f"Snapshot '{name}' saved successfully")
+                # List update handled by the snapshot_saved signal
+                self._set_status(f"Snapshot '{name}' saved successfully")
             else:
-                self.status_bar.showMessage("Failed to save snapshot")
+                self._set_status("Failed to save snapshot")
 
         except Exception as e:
-            self.status_bar.showMessage(f"Error capturing windows: {e}")
+            self._set_status(f"Error capturing windows: {e}")
 
     def capture_all_spaces(self):
         try:
             windows = self.window_manager.get_windows_all_spaces()
             displays = self.window_manager.get_displays()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _auto_timestamp()
             name = f"AllSpaces_{timestamp}"
             description = f"All-spaces capture with {len(windows)} windows"
             success = self.snapshot_manager.save_snapshot(
                 name, description, windows, displays
             )
             if success:
-                self.load_snapshots()
                 has_space = any(getattr(w, "space_id", None) is not None for w in windows)
                 msg = (
                     f"All-spaces snapshot '{name}' saved successfully"
                     if has_space
                     else f"SkyLight unavailable — captured current space only for '{name}'"
                 )
-                self.status_bar.showMessage(msg)
+                self._set_status(msg)
             else:
-                self.status_bar.showMessage("Failed to save all-spaces snapshot")
+                self._set_status("Failed to save all-spaces snapshot")
         except Exception as e:
-            self.status_bar.showMessage(f"Error capturing all spaces: {e}")
+            self._set_status(f"Error capturing all spaces: {e}")
 
     def save_snapshot_dialog(self):
         """Show save snapshot dialog"""
@@ -692,8 +1061,19 @@ class MainWindow(QMainWindow):
             windows = self.window_manager.get_windows()
             displays = self.window_manager.get_displays()
 
-            dialog = SnapshotDialog(self)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
+            # Reuse one dialog instance; rebuilding its widget tree on
+            # every invocation is pure overhead
+            if self._snapshot_dialog is None:
+                self._snapshot_dialog = SnapshotDialog(self)
+            dialog = self._snapshot_dialog
+            dialog.reset_fields()
+            # Don't refresh behind the modal dialog
+            self.update_timer.stop()
+            try:
+                accepted = dialog.exec() == QDialog.DialogCode.Accepted
+            finally:
+                self.update_timer.start(self._refresh_interval())
+            if accepted:
                 name, description = dialog.get_data()
 
                 if not name:
@@ -708,9 +1088,7 @@ class MainWindow(QMainWindow):
                 )
 
                 if success:
-                    self.load_snapshots()
-                    self.select_snapshot_by_name(name)
-                    self.status_bar.showMessage(f"Snapshot '{name}' saved successfully")
+                    self._set_status(f"Snapshot '{name}' saved successfully")
                 else:
                     QMessageBox.critical(self, "Error", "Failed to save snapshot.")
 
@@ -719,13 +1097,9 @@ class MainWindow(QMainWindow):
 
     def restore_selected_snapshot(self):
         """Restore the selected snapshot"""
-        current_item = self.snapshot_list.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Warning", "Please select a snapshot to restore.")
-            return
-
-        snapshot = current_item.data(Qt.ItemDataRole.UserRole)
+        snapshot = self._current_snapshot()
         if not snapshot:
+            QMessageBox.warning(self, "Warning", "Please select a snapshot to restore.")
             return
 
         try:
@@ -734,29 +1108,41 @@ class MainWindow(QMainWindow):
             )
 
             if report is None:
-                self.status_bar.showMessage(
+                self._set_status(
                     f"Failed to restore snapshot '{snapshot.name}'"
                 )
                 return
 
+            # Build the failed-app list once; it feeds both the warning
+            # dialog and the debug log
+            failed_apps = ""
+            if report.failed_count:
+                failed_apps = ", ".join(
+                    sorted(
+                        {
+                            it["app_name"]
+                            for it in report.items
+                            if not it.get("restored")
+                        }
+                    )
+                )
+
             if report.failed_count == 0:
-                self.status_bar.showMessage(
+                self._set_status(
                     f"Restored {report.restored_count}/{report.total} for '{snapshot.name}'"
                 )
             else:
-                failed = [f"{it['app_name']}" for it in report.items if not it.get("restored")]
-                msg = f"Restored {report.restored_count}/{report.total}. Failed: {', '.join(sorted(set(failed)))}"
-                self.status_bar.showMessage(msg)
+                msg = f"Restored {report.restored_count}/{report.total}. Failed: {failed_apps}"
+                self._set_status(msg)
                 QMessageBox.warning(self, "Restore Completed With Failures", msg)
 
-            self.update_window_list()  # Refresh the window list
+            self._refresh_now()  # Refresh the window list
 
             try:
                 self.append_debug_log(
                     f"SNAPSHOT '{snapshot.name}' restored {report.restored_count}/{report.total}"
                 )
-                if report.failed_count:
-                    failed_apps = ", ".join(sorted(set([it["app_name"] for it in report.items if not it.get("restored")])))
+                if failed_apps:
                     self.append_debug_log(f"SNAPSHOT failures: {failed_apps}")
             except Exception:
                 pass
@@ -766,13 +1152,9 @@ class MainWindow(QMainWindow):
 
     def delete_selected_snapshot(self):
         """Delete the selected snapshot"""
-        current_item = self.snapshot_list.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Warning", "Please select a snapshot to delete.")
-            return
-
-        snapshot = current_item.data(Qt.ItemDataRole.UserRole)
+        snapshot = self._current_snapshot()
         if not snapshot:
+            QMessageBox.warning(self, "Warning", "Please select a snapshot to delete.")
             return
 
         reply = QMessageBox.question(
@@ -787,13 +1169,12 @@ class MainWindow(QMainWindow):
                 success = self.snapshot_manager.delete_snapshot(snapshot.name)
 
                 if success:
-                    self.load_snapshots()
                     self.snapshot_info.clear()
-                    self.status_bar.showMessage(
+                    self._set_status(
                         f"Snapshot '{snapshot.name}' deleted successfully"
                     )
                 else:
-                    self.status_bar.showMessage(
+                    self._set_status(
                         f"Failed to delete snapshot '{snapshot.name}'"
                     )
 
@@ -804,9 +1185,9 @@ class MainWindow(QMainWindow):
         try:
             success = self.snapshot_manager.remove_app_from_snapshot(snapshot_name, app_name)
             if success:
-                self.load_snapshots()
-                self.select_snapshot_by_name(snapshot_name)
-                self.status_bar.showMessage(f"Removed '{app_name}' from snapshot '{snapshot_name}'")
+                for key in [k for k in self._json_cache if k[0] == snapshot_name]:
+                    self._json_cache.pop(key, None)
+                self._set_status(f"Removed '{app_name}' from snapshot '{snapshot_name}'")
             else:
                 QMessageBox.warning(self, "Warning", "Application not found or removal failed.")
         except Exception as e:
@@ -873,25 +1254,26 @@ class MainWindow(QMainWindow):
 
     def refresh_permissions(self):
         """Refresh permission status"""
+        # The user may have just edited System Settings; bypass the cache
+        self.permissions_helper.invalidate()
         self.window_manager._permissions_granted = (
             self.window_manager._check_permissions()
         )
-        self.update_window_list()
+        self._refresh_now()
 
         if self.window_manager._permissions_granted:
-            self.status_bar.showMessage("Permissions granted successfully")
+            self._set_status("Permissions granted successfully")
         else:
-            self.status_bar.showMessage(
+            self._set_status(
                 "Permissions still required for full functionality"
             )
 
     def toggle_debug_panel(self):
-        if hasattr(self, "debug_dock"):
-            if self.debug_dock.isVisible():
-                self.debug_dock.hide()
-                if hasattr(self, "view_debug_panel_btn"):
-                    self.view_debug_panel_btn.setText("View Debug Panel")
-            else:
-                self.debug_dock.show()
-                if hasattr(self, "view_debug_panel_btn"):
-                    self.view_debug_panel_btn.setText("Hide Debug Panel")
+        # debug_dock and view_debug_panel_btn are unconditionally created
+        # in init_ui; no per-call hasattr probing needed
+        if self.debug_dock.isVisible():
+            self.debug_dock.hide()
+            self.view_debug_panel_btn.setText("View Debug Panel")
+        else:
+            self.debug_dock.show()
+            self.view_debug_panel_btn.setText("Hide Debug Panel")
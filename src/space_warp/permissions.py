@@ -4,59 +4,109 @@ Permissions helper for macOS accessibility and screen recording permissions
 
 import subprocess
 import platform
+import time
+
+try:
+    # Resolved once at import; the probes run inside the 2s UI refresh
+    # path and a per-call `import Quartz` costs a sys.modules lookup each
+    # time (or a raised ImportError each time when pyobjc is absent)
+    import Quartz as _QUARTZ
+except ImportError:
+    _QUARTZ = None
 
 
 class PermissionsHelper:
     """Helper for checking and requesting macOS permissions"""
 
-    @staticmethod
-    def check_accessibility_permissions() -> bool:
+    # Permission state only changes when the user edits System Settings,
+    # so probe results are cached briefly; the probes are WindowServer
+    # round-trips and the UI re-checks them on every refresh
+    _CACHE_TTL = 5.0
+    _cache: dict[str, tuple[float, bool]] = {}
+
+    @classmethod
+    def _cached(cls, key: str, probe) -> bool:
+        entry = cls._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < cls._CACHE_TTL:
+            return entry[1]
+        value = probe()
+        cls._cache[key] = (now, value)
+        return value
+
+    @classmethod
+    def invalidate(cls):
+        """Drop cached probe results (call after the user may have
+        changed permissions in System Settings)"""
+        cls._cache.clear()
+
+    @classmethod
+    def check_accessibility_permissions(cls) -> bool:
         """Check if the app has accessibility permissions"""
+        return cls._cached("accessibility", cls._probe_accessibility)
+
+    @classmethod
+    def check_screen_recording_permissions(cls) -> bool:
+        """Check if the app has screen recording permissions"""
+        return cls._cached("screen_recording", cls._probe_screen_recording)
+
+    @staticmethod
+    def _probe_accessibility() -> bool:
+        if _QUARTZ is None:
+            return False
         try:
             # Test if we can access window information
-            import Quartz
-
-            window_list = Quartz.CGWindowListCopyWindowInfo(
-                Quartz.kCGWindowListOptionOnScreenOnly, Quartz.kCGNullWindowID
+            window_list = _QUARTZ.CGWindowListCopyWindowInfo(
+                _QUARTZ.kCGWindowListOptionOnScreenOnly, _QUARTZ.kCGNullWindowID
             )
             return window_list is not None
         except Exception:
             return False
 
     @staticmethod
-    def check_screen_recording_permissions() -> bool:
-        """Check if the app has screen recording permissions"""
+    def _probe_screen_recording() -> bool:
+        if _QUARTZ is None:
+            return False
         try:
-            import Quartz
-
             # Try to get display info which requires screen recording permission
-            main_display = Quartz.CGMainDisplayID()
+            main_display = _QUARTZ.CGMainDisplayID()
             if main_display == 0:
                 return False
 
             # Try to get display bounds
-            bounds = Quartz.CGDisplayBounds(main_display)
+            bounds = _QUARTZ.CGDisplayBounds(main_display)
             return bounds is not None
         except Exception:
             return False
 
-    @staticmethod
-    def get_missing_permissions() -> list[str]:
+    @classmethod
+    def check_all(cls) -> tuple[bool, bool]:
+        """Probe both permissions in one call
+
+        Returns (accessibility, screen_recording); each side hits the
+        TTL cache so callers can re-check freely.
+        """
+        return (
+            cls.check_accessibility_permissions(),
+            cls.check_screen_recording_permissions(),
+        )
+
+    @classmethod
+    def get_missing_permissions(cls) -> list[str]:
         """Get list of missing permissions"""
-        missing = []
+        accessibility, screen_recording = cls.check_all()
 
-        if not PermissionsHelper.check_accessibility_permissions():
+        missing = []
+        if not accessibility:
             missing.append("Accessibility")
-
-        if not PermissionsHelper.check_screen_recording_permissions():
+        if not screen_recording:
             missing.append("Screen Recording")
 
         return missing
 
-    @staticmethod
-    def request_permissions_instructions() -> str:
-        """Get instructions for granting permissions"""
-        instructions = """
+    # Immutable help text; stripped once at class creation instead of
+    # per call
+    _INSTRUCTIONS = """
 To use SpaceWarp, you need to grant the following permissions:
 
 1. **Accessibility Permission** (required for window management):
@@ -74,20 +124,29 @@ To use SpaceWarp, you need to grant the following permissions:
 3. **Restart the application** after granting permissions
 
 Note: You may see a security prompt when the app tries to access these features for the first time.
-"""
-        return instructions.strip()
+""".strip()
+
+    @classmethod
+    def request_permissions_instructions(cls) -> str:
+        """Get instructions for granting permissions"""
+        return cls._INSTRUCTIONS
 
     @staticmethod
     def open_system_preferences():
         """Open System Preferences to the Privacy section"""
         try:
-            subprocess.run(
+            # Fire-and-forget: don't block the GUI thread on open(1)
+            subprocess.Popen(
                 [
                     "open",
                     "/System/Library/PreferencePanes/Security.prefPane",
                     "--args",
                     "Privacy_Accessibility",
-                ]
+                ],
+                start_new_session=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
         except Exception as e:
             print(f"Could not open System Preferences: {e}")
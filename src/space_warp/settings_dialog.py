@@ -13,12 +13,76 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
+# All colors are literals, so the stylesheet is a fixed string; build it
+# once at import instead of re-interpolating per dialog open
+_ACCENT = "#2A82DA"
+_BG = "#FFFFFF"
+_FG = "#2D2D2D"
+_BORDER = "#D0D0D0"
+_TAB_BG = "#F5F5F5"
+
+# Every selector is scoped to the dialog's object name: unscoped rules
+# like `QLabel { ... }` force Qt to re-polish every widget in the
+# application, not just this dialog's
+_DIALOG_CSS = f"""
+QDialog#SpaceWarpSettings {{
+    background-color: {_BG};
+    font-size: 15px;
+}}
+#SpaceWarpSettings QTabWidget::pane {{
+    border: 1px solid {_BORDER};
+    border-radius: 8px;
+    padding: 6px;
+}}
+#SpaceWarpSettings QTabBar::tab {{
+    background: {_TAB_BG};
+    color: {_FG};
+    border: 1px solid {_BORDER};
+    padding: 8px 16px;
+    margin: 2px;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+    font-size: 15px;
+}}
+#SpaceWarpSettings QTabBar::tab:selected {{
+    background: {_ACCENT};
+    color: white;
+}}
+#SpaceWarpSettings QLabel {{ color: {_FG}; font-size: 15px; }}
+#SpaceWarpSettings QCheckBox {{ color: {_FG}; font-size: 15px; }}
+#SpaceWarpSettings QLineEdit, #SpaceWarpSettings QSpinBox {{
+    background: #FFFFFF;
+    color: {_FG};
+    border: 1px solid {_BORDER};
+    border-radius: 6px;
+    padding: 6px 8px;
+    font-size: 15px;
+}}
+#SpaceWarpSettings QDialogButtonBox QPushButton {{
+    background: {_ACCENT};
+    color: white;
+    border: none;
+    padding: 10px 18px;
+    border-radius: 6px;
+    font-size: 16px;
+    min-height: 36px;
+}}
+#SpaceWarpSettings QDialogButtonBox QPushButton:hover {{
+    background: #1E6FB9;
+}}
+#SpaceWarpSettings QDialogButtonBox QPushButton:disabled {{
+    background: #E0E0E0;
+    color: #9A9A9A;
+}}
+"""
+
 
 class SettingsDialog(QDialog):
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
         self.setWindowTitle("Settings")
+        self.setObjectName("SpaceWarpSettings")
         self.resize(560, 420)
         root = QVBoxLayout(self)
         self.tabs = QTabWidget()
@@ -31,10 +95,17 @@ class SettingsDialog(QDialog):
         self.tabs.addTab(self.hotkeys_tab, "Hotkeys")
         self.tabs.addTab(self.display_tab, "Display")
         self.tabs.addTab(self.snapshots_tab, "Snapshots")
-        self._build_general()
-        self._build_hotkeys()
-        self._build_display()
-        self._build_snapshots()
+        # Only the visible tab is built up front; the rest are filled on
+        # first selection (or when _apply needs their widgets)
+        self._builders = {
+            0: self._build_general,
+            1: self._build_hotkeys,
+            2: self._build_display,
+            3: self._build_snapshots,
+        }
+        self._built: set[int] = set()
+        self._ensure_tab_built(0)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok
             | QDialogButtonBox.StandardButton.Apply
@@ -48,6 +119,11 @@ class SettingsDialog(QDialog):
         root.addWidget(buttons)
         self._apply_stylesheet()
 
+    def _ensure_tab_built(self, index: int):
+        if index not in self._built:
+            self._built.add(index)
+            self._builders[index]()
+
     def _build_general(self):
         layout = QFormLayout(self.general_tab)
         self.start_minimized_chk = QCheckBox("Start minimized")
@@ -95,88 +171,28 @@ class SettingsDialog(QDialog):
         layout.addRow(QLabel("Max snapshots"), self.max_snapshots_spin)
 
     def _apply(self):
-        self.config.set("start_minimized", self.start_minimized_chk.isChecked())
-        self.config.set("auto_start", self.auto_start_chk.isChecked())
-        self.config.set("hotkeys.save_snapshot", self.hk_save_edit.text().strip())
-        self.config.set("hotkeys.restore_last_snapshot", self.hk_restore_edit.text().strip())
-        self.config.set("hotkeys.toggle_window_manager", self.hk_toggle_edit.text().strip())
-        self.config.set(
-            "display.auto_adjust_missing_displays",
-            self.auto_adjust_chk.isChecked(),
-        )
-        self.config.set(
-            "display.prompt_for_missing_displays",
-            self.prompt_missing_chk.isChecked(),
+        # Unbuilt tabs still hold their config values in widgets-to-be;
+        # build them so every setting below reads from a live widget
+        for index in self._builders:
+            self._ensure_tab_built(index)
+        # One batched update -> one scheduled config write
+        self.config.update(
+            {
+                "start_minimized": self.start_minimized_chk.isChecked(),
+                "auto_start": self.auto_start_chk.isChecked(),
+                "hotkeys.save_snapshot": self.hk_save_edit.text().strip(),
+                "hotkeys.restore_last_snapshot": self.hk_restore_edit.text().strip(),
+                "hotkeys.toggle_window_manager": self.hk_toggle_edit.text().strip(),
+                "display.auto_adjust_missing_displays": self.auto_adjust_chk.isChecked(),
+                "display.prompt_for_missing_displays": self.prompt_missing_chk.isChecked(),
+                "snapshots.auto_save_interval": int(self.auto_save_spin.value()),
+                "snapshots.max_snapshots": int(self.max_snapshots_spin.value()),
+            }
         )
-        self.config.set("snapshots.auto_save_interval", int(self.auto_save_spin.value()))
-        self.config.set("snapshots.max_snapshots", int(self.max_snapshots_spin.value()))
 
     def _apply_and_accept(self):
         self._apply()
         self.accept()
 
     def _apply_stylesheet(self):
-        accent = "#2A82DA"
-        bg = "#FFFFFF"
-        fg = "#2D2D2D"
-        muted = "#7A7A7A"
-        border = "#D0D0D0"
-        tab_bg = "#F5F5F5"
-        css = f"""
-        QDialog {{
-            background-color: {bg};
-            font-size: 15px;
-        }}
-        QTabWidget::pane {{
-            border: 1px solid {border};
-            border-radius: 8px;
-            padding: 6px;
-        }}
-        QTabBar::tab {{
-            background: {tab_bg};
-            color: {fg};
-            border: 1px solid {border};
-            padding: 8px 16px;
-            margin: 2px;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-            font-size: 15px;
-        }}
-        QTabBar::tab:selected {{
-            background: {accent};
-            color: white;
-        }}
-        QGroupBox {{
-            border: 1px solid {border};
-            border-radius: 8px;
-            margin-top: 12px;
-        }}
-        QLabel {{ color: {fg}; font-size: 15px; }}
-        QCheckBox {{ color: {fg}; font-size: 15px; }}
-        QLineEdit, QSpinBox {{
-            background: #FFFFFF;
-            color: {fg};
-            border: 1px solid {border};
-            border-radius: 6px;
-            padding: 6px 8px;
-            font-size: 15px;
-        }}
-        QLineEdit::placeholder {{ color: {muted}; }}
-        QDialogButtonBox QPushButton {{
-            background: {accent};
-            color: white;
-            border: none;
-            padding: 10px 18px;
-            border-radius: 6px;
-            font-size: 16px;
-            min-height: 36px;
-        }}
-        QDialogButtonBox QPushButton:hover {{
-            background: #1E6FB9;
-        }}
-        QDialogButtonBox QPushButton:disabled {{
-            background: #E0E0E0;
-            color: #9A9A9A;
-        }}
-        """
-        self.setStyleSheet(css)
\ No newline at end of file
+        self.setStyleSheet(_DIALOG_CSS)
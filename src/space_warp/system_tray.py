@@ -0,0 +1,209 @@
+"""
+System tray icon for SpaceWarp
+"""
+
+import os
+import sys
+from datetime import datetime
+from functools import lru_cache, partial
+
+from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
+from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from .window_manager import WindowManager
+from .snapshot_manager import SnapshotManager
+from .config import Config
+
+
+@lru_cache(maxsize=64)
+def _resource_path(relative: str) -> str:
+    """Resolve a bundled resource, whether running from source or from
+    the PyInstaller bundle
+
+    Memoized: resolution stats the filesystem up to twice per lookup and
+    resources never move while the app runs.
+    """
+    base = getattr(sys, "_MEIPASS", None)
+    if base:
+        candidate = os.path.join(base, relative)
+        if os.path.exists(candidate):
+            return candidate
+    here = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    candidate = os.path.join(here, relative)
+    if os.path.exists(candidate):
+        return candidate
+    return relative
+
+
+# Decoded icons by resolved path; repeated lookups skip the PNG decode
+_ICON_CACHE: dict[str, QIcon] = {}
+
+
+def _resource_icon(relative: str) -> QIcon:
+    path = _resource_path(relative)
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QIcon(path)
+    return icon
+
+
+class _RestoreSignals(QObject):
+    finished = pyqtSignal(str, bool)
+
+
+class RestoreTask(QRunnable):
+    """Runs a snapshot restore off the GUI thread"""
+
+    def __init__(self, snapshot_manager, window_manager, name, signals):
+        super().__init__()
+        self.snapshot_manager = snapshot_manager
+        self.window_manager = window_manager
+        self.name = name
+        self.signals = signals
+
+    def run(self):
+        try:
+            ok = self.snapshot_manager.restore_snapshot(self.name, self.window_manager)
+        except Exception:
+            ok = False
+        self.signals.finished.emit(self.name, bool(ok))
+
+
+class SystemTrayIcon(QSystemTrayIcon):
+    """Tray icon with quick save/restore access
+
+    Shares the application's WindowManager and SnapshotManager instances
+    instead of constructing its own, and defers every SQLite hit until
+    the user actually opens the Restore Layout submenu.
+    """
+
+    def __init__(
+        self,
+        window_manager: WindowManager,
+        snapshot_manager: SnapshotManager,
+        config: Config,
+        main_window=None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.window_manager = window_manager
+        self.snapshot_manager = snapshot_manager
+        self.config = config
+        self.main_window = main_window
+
+        self.setIcon(_resource_icon("assets/space-warp-icon.png"))
+        self.setToolTip("SpaceWarp")
+
+        # Rebuild the restore submenu only when its contents may have
+        # changed; repeat opens reuse the existing actions
+        self._restore_menu_dirty = True
+        self.snapshot_manager.snapshot_saved.connect(self._mark_restore_menu_dirty)
+        self.snapshot_manager.snapshot_deleted.connect(self._mark_restore_menu_dirty)
+
+        # Restores run on the shared thread pool; results come back to
+        # the GUI thread via a queued signal
+        self._pool = QThreadPool.globalInstance()
+        self._restore_signals = _RestoreSignals(self)
+        self._restore_signals.finished.connect(self._on_restore_finished)
+        self._restore_inflight = False
+
+        self.create_context_menu()
+
+    def create_context_menu(self):
+        menu = QMenu()
+
+        save_action = menu.addAction("Save Snapshot")
+        save_action.triggered.connect(self.save_snapshot)
+
+        # The submenu is populated on first hover, so startup never
+        # touches the snapshot database
+        self._restore_menu = menu.addMenu("Restore Layout")
+        self._restore_menu.aboutToShow.connect(self._on_restore_menu_about_to_show)
+
+        menu.addSeparator()
+
+        show_action = menu.addAction("Show Main Window")
+        show_action.triggered.connect(self.show_main_window)
+
+        menu.addSeparator()
+
+        quit_action = menu.addAction("Quit")
+        quit_action.triggered.connect(self._quit)
+
+        self.setContextMenu(menu)
+        self._menu = menu
+
+    def _mark_restore_menu_dirty(self, _name: str = ""):
+        self._restore_menu_dirty = True
+
+    def _on_restore_menu_about_to_show(self):
+        if self._restore_menu_dirty:
+            self._restore_menu_dirty = False
+            self.populate_restore_menu(self._restore_menu)
+
+    def populate_restore_menu(self, menu: QMenu):
+        """Fill the restore submenu from the snapshot database"""
+        menu.clear()
+        added = False
+        try:
+            # Stream names off the cursor; no intermediate list. partial
+            # is cheaper per action than a lambda (no closure frame)
+            for name in self.snapshot_manager.iter_active_names():
+                action = menu.addAction(name)
+                action.triggered.connect(partial(self._on_restore_triggered, name))
+                added = True
+        except Exception:
+            pass
+        if not added:
+            empty = menu.addAction("No snapshots")
+            empty.setEnabled(False)
+
+    def save_snapshot(self):
+        """Capture the current layout under an auto-generated name"""
+        try:
+            windows = self.window_manager.get_windows()
+            displays = self.window_manager.get_displays()
+            name = f"Tray_{datetime.now():%Y%m%d_%H%M%S}"
+            description = f"Tray capture with {len(windows)} windows"
+            if self.snapshot_manager.save_snapshot(name, description, windows, displays):
+                self.showMessage("SpaceWarp", f"Snapshot '{name}' saved")
+            else:
+                self.showMessage("SpaceWarp", "Failed to save snapshot")
+        except Exception as e:
+            self.showMessage("SpaceWarp", f"Error saving snapshot: {e}")
+
+    def _on_restore_triggered(self, name: str, checked: bool = False):
+        self.restore_snapshot(name)
+
+    def restore_snapshot(self, name: str):
+        """Restore a snapshot on a worker thread; the menu dismisses and
+        the tray stays responsive while windows move"""
+        if self._restore_inflight:
+            return
+        self._restore_inflight = True
+        self._pool.start(
+            RestoreTask(
+                self.snapshot_manager, self.window_manager, name, self._restore_signals
+            )
+        )
+
+    def _on_restore_finished(self, name: str, ok: bool):
+        self._restore_inflight = False
+        if ok:
+            self.showMessage("SpaceWarp", f"Restored '{name}'")
+        else:
+            self.showMessage("SpaceWarp", f"Failed to restore '{name}'")
+
+    def show_main_window(self):
+        if self.main_window is not None:
+            self.main_window.show()
+            self.main_window.raise_()
+            self.main_window.activateWindow()
+
+    def _quit(self):
+        from PyQt6.QtWidgets import QApplication
+
+        app = QApplication.instance()
+        if app is not None:
+            app.quit()
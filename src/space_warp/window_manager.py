@@ -2,19 +2,69 @@
 Window management system for capturing and restoring app layouts
 """
 
+import atexit
+import logging
+import sys
 import time
 from typing import Any
 import subprocess
 from dataclasses import dataclass
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 import ctypes
 from PyQt6.QtWidgets import QApplication
 
 import Quartz
 from AppKit import NSWorkspace
+from Foundation import NSAutoreleasePool
 
+log = logging.getLogger(__name__)
 
-@dataclass
+# Safety-net lifetime for the cached display list. Both the Quartz
+# reconfiguration callback and the Qt screen signals invalidate the
+# cache the moment topology changes; the TTL only covers a missed event
+_DISPLAY_CACHE_TTL = 30.0
+
+# Lifetime of the capture micro-cache; long enough to dedupe a save flow
+# that captures twice in a row, short enough that restore polling still
+# observes newly appeared windows promptly
+_CAPTURE_CACHE_TTL = 0.2
+
+# bundle id -> NSURL resolved through LaunchServices; module-level so
+# the cache never pins a WindowManager instance
+_BUNDLE_URL_CACHE: dict[str, Any] = {}
+
+# PyObjC resolves Quartz.kCGWindow* attributes through the framework
+# bundle on each access; bind the hot-loop keys once at import
+_K_LAYER = Quartz.kCGWindowLayer
+_K_OWNER = Quartz.kCGWindowOwnerName
+_K_NAME = Quartz.kCGWindowName
+_K_PID = Quartz.kCGWindowOwnerPID
+_K_NUMBER = Quartz.kCGWindowNumber
+_K_BOUNDS = Quartz.kCGWindowBounds
+_WINDOW_LIST_OPTS = (
+    Quartz.kCGWindowListOptionOnScreenOnly
+    | Quartz.kCGWindowListExcludeDesktopElements
+)
+_WINDOW_LIST_ALL_OPTS = (
+    Quartz.kCGWindowListOptionAll | Quartz.kCGWindowListExcludeDesktopElements
+)
+
+# System processes whose layer-0 windows are never user windows; a
+# frozenset gives O(1) membership without a per-iteration list build
+_SKIP_OWNERS = frozenset({"Window Server", "Dock", "SystemUIServer", "WindowManager"})
+
+# Fallback validity for the pid->app cache when the workspace
+# launch/terminate observers could not be registered
+_APP_CACHE_TTL = 1.0
+
+
+class _CFRange(ctypes.Structure):
+    """CFRange for bulk CFArrayGetValues copies"""
+
+    _fields_ = [("location", ctypes.c_long), ("length", ctypes.c_long)]
+
+
+@dataclass(slots=True, frozen=True)
 class WindowInfo:
     """Information about a window"""
 
@@ -32,8 +82,27 @@ class WindowInfo:
     space_id: int | None = None
     window_id: int | None = None
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        """Plain-dict view for serialization; avoids asdict's recursive
+        deep copy on the snapshot save path"""
+        return {
+            "app_name": self.app_name,
+            "window_title": self.window_title,
+            "x": self.x,
+            "y": self.y,
+            "width": self.width,
+            "height": self.height,
+            "is_minimized": self.is_minimized,
+            "is_hidden": self.is_hidden,
+            "display_id": self.display_id,
+            "pid": self.pid,
+            "bundle_id": self.bundle_id,
+            "space_id": self.space_id,
+            "window_id": self.window_id,
+        }
+
+
+@dataclass(slots=True, frozen=True)
 class DisplayInfo:
     """Information about a display"""
 
@@ -45,11 +114,57 @@ class DisplayInfo:
     y: int
     is_main: bool
 
+    def to_dict(self) -> dict:
+        """Plain-dict view for serialization"""
+        return {
+            "display_id": self.display_id,
+            "name": self.name,
+            "width": self.width,
+            "height": self.height,
+            "x": self.x,
+            "y": self.y,
+            "is_main": self.is_main,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class RunningApp:
+    """Snapshot of one running application
+
+    Names and bundle ids are interned on construction: the same handful
+    of strings recur across every enumeration, and interning lets
+    equality checks against them short-circuit on identity.
+    """
+
+    name: str
+    bundle_id: str
+    pid: int
+    is_hidden: bool
+    is_active: bool
+
+
+class _CaptureTask(QRunnable):
+    """Runs a window capture off the GUI thread"""
+
+    def __init__(self, manager: "WindowManager", app_name: str | None):
+        super().__init__()
+        self.manager = manager
+        self.app_name = app_name
+
+    def run(self):
+        try:
+            self.manager.get_windows(self.app_name)
+        except Exception as e:
+            log.warning("Error capturing windows: %s", e)
+        finally:
+            self.manager._capture_inflight = False
+
 
 class WindowManager(QObject):
     """Manages window capture and restoration"""
 
     window_captured = pyqtSignal(WindowInfo)
+    windows_captured = pyqtSignal(list)  # one emit per capture pass
     window_restored = pyqtSignal(str, str)  # app_name, window_title
     window_restore_started = pyqtSignal(str, str)
     window_restore_failed = pyqtSignal(str, str, str)
@@ -59,10 +174,51 @@ class WindowManager(QObject):
     def __init__(self):
         super().__init__()
         self.workspace = NSWorkspace.sharedWorkspace()
+        # Memoized CGMainDisplayID; _check_permissions fills it and the
+        # reconfiguration callback refreshes it
+        self._main_display_id = 0
         self._permissions_granted = self._check_permissions()
         self._skylight = None
         self._cf = None
         self._init_skylight()
+        # Display enumeration crosses the ObjC bridge several times per
+        # call and _get_display_for_window runs once per captured window;
+        # cache the list and invalidate on screen reconfiguration
+        self._cached_displays: list[DisplayInfo] | None = None
+        self._displays_cache_ts = 0.0
+        # Lazily created output buffer for CGGetOnlineDisplayList
+        self._displays_buf = None
+        self._cached_rects: tuple[tuple[int, int, int, int, int], ...] | None = None
+        self._register_reconfiguration_callback()
+        # Guards capture_async against overlapping pool submissions
+        self._capture_inflight = False
+        # (options, app_name, skip_unnamed) -> (timestamp, windows);
+        # dedupes back-to-back identical captures within the short TTL
+        self._capture_cache: dict[
+            tuple[int, str | None, bool], tuple[float, list[WindowInfo]]
+        ] = {}
+        # pid -> NSRunningApplication, rebuilt lazily; launch/terminate
+        # notifications drop it, with a short TTL as the safety net
+        self._apps_by_pid: dict[int, Any] | None = None
+        self._apps_by_name: dict[str, Any] = {}
+        self._apps_by_bundle: dict[str, Any] = {}
+        self._apps_cache_ts = 0.0
+        self._observer_tokens: list[Any] = []
+        self._register_app_list_observers()
+        # (app_name, bundle_id) -> launch strategy that succeeded, so
+        # repeat launches skip the attempts that already failed
+        self._launch_method_cache: dict[tuple[str, str | None], str] = {}
+        # Compiled once; filters the CG window list to layer-0 windows
+        # from non-system owners in ObjC before the Python loop sees it
+        try:
+            from Foundation import NSPredicate
+
+            self._window_predicate = NSPredicate.predicateWithFormat_argumentArray_(
+                "kCGWindowLayer == 0 AND NOT (kCGWindowOwnerName IN %@)",
+                [list(_SKIP_OWNERS)],
+            )
+        except Exception:
+            self._window_predicate = None
 
     # ------------------------------
     # App visibility helpers
@@ -75,62 +231,146 @@ class WindowManager(QObject):
                 app_ref.hide()
                 return True
         except Exception as e:
-            print(f"Error hiding app: {e}")
+            log.warning("Error hiding app: %s", e)
         return False
 
     def _init_skylight(self) -> None:
+        self._k_spaces = self._k_id64 = self._k_windows = None
+        self._sls_conn = None
+        self._SLSCopyManagedDisplaySpaces = None
+        self._CFArrayGetCount = None
+        self._CFArrayGetValues = None
+        self._CFDictionaryGetValue = None
+        self._CFNumberGetValue = None
+        self._CFRelease = None
         try:
             self._skylight = ctypes.CDLL("/System/Library/PrivateFrameworks/SkyLight.framework/SkyLight")
             self._cf = ctypes.CDLL("/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation")
         except Exception:
             self._skylight = None
             self._cf = None
-
-    def _window_to_space_map(self) -> dict[int, int]:
-        if not self._skylight or not self._cf:
-            return {}
+            return
+        # Dictionary keys for _window_to_space_map, created once; the old
+        # per-iteration CFStringCreateWithCString calls allocated (and
+        # leaked) three CFStrings per space per capture pass
         try:
-            conn = ctypes.c_uint32.in_dll(self._skylight, "SLSMainConnectionID")
+            create = self._cf.CFStringCreateWithCString
+            create.restype = ctypes.c_void_p
+            kCFStringEncodingUTF8 = 0x08000100
+            self._k_spaces = ctypes.c_void_p(create(None, b"Spaces", kCFStringEncodingUTF8))
+            self._k_id64 = ctypes.c_void_p(create(None, b"id64", kCFStringEncodingUTF8))
+            self._k_windows = ctypes.c_void_p(create(None, b"Windows", kCFStringEncodingUTF8))
+            atexit.register(self._release_cf_keys)
         except Exception:
+            self._k_spaces = self._k_id64 = self._k_windows = None
+        # Resolve and type the hot symbols once; every getattr on a CDLL
+        # re-resolves the symbol and wraps a fresh function pointer
+        try:
+            cf = self._cf
+            self._CFArrayGetCount = cf.CFArrayGetCount
+            self._CFArrayGetCount.restype = ctypes.c_long
+            self._CFArrayGetValues = cf.CFArrayGetValues
+            self._CFArrayGetValues.restype = None
+            self._CFArrayGetValues.argtypes = [
+                ctypes.c_void_p,
+                _CFRange,
+                ctypes.c_void_p,
+            ]
+            self._CFDictionaryGetValue = cf.CFDictionaryGetValue
+            self._CFDictionaryGetValue.restype = ctypes.c_void_p
+            self._CFNumberGetValue = cf.CFNumberGetValue
+            self._CFNumberGetValue.restype = ctypes.c_bool
+            self._CFRelease = cf.CFRelease
+            self._CFRelease.restype = None
+            self._SLSCopyManagedDisplaySpaces = self._skylight.SLSCopyManagedDisplaySpaces
+            self._SLSCopyManagedDisplaySpaces.restype = ctypes.c_void_p
+            # The SkyLight connection id is stable for the process
             try:
-                get_conn = getattr(self._skylight, "SLSMainConnectionID")
-                get_conn.restype = ctypes.c_uint32
-                conn = ctypes.c_uint32(get_conn())
+                self._sls_conn = ctypes.c_uint32.in_dll(
+                    self._skylight, "SLSMainConnectionID"
+                )
             except Exception:
-                return {}
+                get_conn = self._skylight.SLSMainConnectionID
+                get_conn.restype = ctypes.c_uint32
+                self._sls_conn = ctypes.c_uint32(get_conn())
+        except Exception:
+            self._SLSCopyManagedDisplaySpaces = None
+            self._sls_conn = None
+
+    def _release_cf_keys(self) -> None:
+        """Release the cached CFString keys (registered with atexit)"""
+        try:
+            for key in (self._k_spaces, self._k_id64, self._k_windows):
+                if key:
+                    self._cf.CFRelease(key)
+        except Exception:
+            pass
+
+    def _window_to_space_map(self) -> dict[int, int]:
+        if self._SLSCopyManagedDisplaySpaces is None or self._sls_conn is None:
+            return {}
+        if not self._k_spaces:
+            return {}
         try:
-            copy_spaces = getattr(self._skylight, "SLSCopyManagedDisplaySpaces")
-            copy_spaces.restype = ctypes.c_void_p
-            spaces_ref = copy_spaces(conn)
+            spaces_ref = self._SLSCopyManagedDisplaySpaces(self._sls_conn)
             if not spaces_ref:
                 return {}
         except Exception:
             return {}
         try:
-            CFArrayGetCount = self._cf.CFArrayGetCount
-            CFArrayGetCount.restype = ctypes.c_long
-            CFArrayGetValueAtIndex = self._cf.CFArrayGetValueAtIndex
-            CFArrayGetValueAtIndex.restype = ctypes.c_void_p
-            CFDictionaryGetValue = self._cf.CFDictionaryGetValue
-            CFDictionaryGetValue.restype = ctypes.c_void_p
-            CFStringCreateWithCString = self._cf.CFStringCreateWithCString
-            CFStringCreateWithCString.restype = ctypes.c_void_p
-            CFNumberGetValue = self._cf.CFNumberGetValue
-            CFNumberGetValue.restype = ctypes.c_bool
-            kCFStringEncodingUTF8 = 0x08000100
+            # Fast path: CFArray/CFDictionary are toll-free bridged, so
+            # one pyobjc wrap turns the whole structure into native
+            # containers and the walk stays inside the bridge's C code
+            # instead of paying a ctypes FFI crossing per value. The
+            # proxy retains the ref; the finally-release stays balanced.
+            try:
+                import objc
+
+                bridged = objc.objc_object(c_void_p=spaces_ref)
+            except Exception:
+                bridged = None
+            if bridged is not None:
+                try:
+                    result = {}
+                    for display_dict in bridged:
+                        for space_dict in display_dict.get("Spaces") or ():
+                            id64 = space_dict.get("id64")
+                            wids = space_dict.get("Windows")
+                            if id64 is None or not wids:
+                                continue
+                            sid = int(id64)
+                            for wid in wids:
+                                result[int(wid)] = sid
+                    return result
+                except Exception:
+                    # Fall through to the ctypes walk below
+                    pass
+
+            # Pre-bound in _init_skylight; locals for the tight loops
+            CFArrayGetCount = self._CFArrayGetCount
+            CFArrayGetValues = self._CFArrayGetValues
+            CFDictionaryGetValue = self._CFDictionaryGetValue
+            CFNumberGetValue = self._CFNumberGetValue
+            key_spaces = self._k_spaces
+            key_id64 = self._k_id64
+            key_windows = self._k_windows
+
+            def _array_values(arr) -> list:
+                # One FFI crossing for the whole array instead of a
+                # CFArrayGetValueAtIndex call per element
+                n = CFArrayGetCount(arr)
+                if n <= 0:
+                    return []
+                buf = (ctypes.c_void_p * n)()
+                CFArrayGetValues(arr, _CFRange(0, n), buf)
+                return [ctypes.c_void_p(value) for value in buf]
+
             result: dict[int, int] = {}
-            count = CFArrayGetCount(spaces_ref)
-            for i in range(count):
-                display_dict = CFArrayGetValueAtIndex(spaces_ref, i)
-                key_spaces = CFStringCreateWithCString(None, b"Spaces", kCFStringEncodingUTF8)
+            for display_dict in _array_values(spaces_ref):
                 spaces_arr = CFDictionaryGetValue(display_dict, key_spaces)
                 if not spaces_arr:
                     continue
-                scount = CFArrayGetCount(spaces_arr)
-                for j in range(scount):
-                    space_dict = CFArrayGetValueAtIndex(spaces_arr, j)
-                    key_id64 = CFStringCreateWithCString(None, b"id64", kCFStringEncodingUTF8)
-                    key_windows = CFStringCreateWithCString(None, b"Windows", kCFStringEncodingUTF8)
+                for space_dict in _array_values(spaces_arr):
                     id64_ref = CFDictionaryGetValue(space_dict, key_id64)
                     windows_arr = CFDictionaryGetValue(space_dict, key_windows)
                     if not id64_ref or not windows_arr:
@@ -139,16 +379,20 @@ class WindowManager(QObject):
                     ok = CFNumberGetValue(id64_ref, 9, ctypes.byref(space_id))
                     if not ok:
                         continue
-                    wcount = CFArrayGetCount(windows_arr)
-                    for k in range(wcount):
-                        wref = CFArrayGetValueAtIndex(windows_arr, k)
-                        wid = ctypes.c_int()
-                        ok2 = CFNumberGetValue(wref, 9, ctypes.byref(wid))
-                        if ok2:
-                            result[int(wid.value)] = int(space_id.value)
+                    sid = int(space_id.value)
+                    wid = ctypes.c_int()
+                    for wref in _array_values(windows_arr):
+                        if CFNumberGetValue(wref, 9, ctypes.byref(wid)):
+                            result[int(wid.value)] = sid
             return result
         except Exception:
             return {}
+        finally:
+            # Copy rule: SLSCopyManagedDisplaySpaces transfers ownership
+            try:
+                self._CFRelease(ctypes.c_void_p(spaces_ref))
+            except Exception:
+                pass
 
     def _unhide_app_by_ref(self, app_ref) -> bool:
         """Unhide an NSRunningApplication reference. Returns True if a request was made."""
@@ -157,22 +401,22 @@ class WindowManager(QObject):
                 app_ref.unhide()
                 return True
         except Exception as e:
-            print(f"Error unhiding app: {e}")
+            log.warning("Error unhiding app: %s", e)
         return False
 
-    def _hide_non_profile_apps(self, snapshot) -> None:
-        """Hide all currently running regular apps that are not present in the target snapshot.
+    def _apply_profile_visibility(self, snapshot, keep_pids=()) -> None:
+        """Reconcile app visibility against the target snapshot in one pass.
 
-        The goal is to keep non‑profile apps safe (not quit) while keeping the
-        workspace focused. Apps included in the snapshot will remain visible or
-        get unhidden during restore.
+        Regular apps outside the profile are hidden (never quit, to keep
+        them safe); apps the restore is about to touch — matched by pid,
+        bundle id or name — are unhidden here, so the per-window loop
+        never pays a hide-then-unhide double round-trip.
         """
         try:
-            running = self.workspace.runningApplications()
             keep_names = {w.app_name for w in snapshot.windows if getattr(w, 'app_name', None)}
             keep_bundles = {w.bundle_id for w in snapshot.windows if getattr(w, 'bundle_id', None)}
 
-            for app in running:
+            for pid, app in self._pid_app_map().items():
                 try:
                     # Skip non-regular apps
                     if app.activationPolicy() != 0:
@@ -189,8 +433,14 @@ class WindowManager(QObject):
                     except Exception:
                         pass
 
-                    # If app is part of the profile (by bundle id or name), do not hide
-                    if (bid and bid in keep_bundles) or (name and name in keep_names):
+                    # Profile apps (by pid, bundle id or name) are made
+                    # visible now; everything else gets hidden
+                    if (
+                        pid in keep_pids
+                        or (bid and bid in keep_bundles)
+                        or (name and name in keep_names)
+                    ):
+                        self._unhide_app_by_ref(app)
                         continue
 
                     self._hide_app_by_ref(app)
@@ -198,16 +448,18 @@ class WindowManager(QObject):
                     # Continue on best-effort basis
                     continue
         except Exception as e:
-            print(f"Error hiding non-profile apps: {e}")
+            log.warning("Error reconciling app visibility: %s", e)
 
     def _check_permissions(self) -> bool:
         """Check if the app has necessary permissions"""
         try:
-            # Test basic Quartz functionality
+            # Test basic Quartz functionality; keep the id around — it
+            # only changes on display reconfiguration
             main_display = Quartz.CGMainDisplayID()
+            self._main_display_id = main_display
             return main_display != 0
         except Exception as e:
-            print(f"Permission check failed: {e}")
+            log.warning("Permission check failed: %s", e)
             return False
 
     def _get_main_display_fallback(self) -> list[DisplayInfo]:
@@ -229,7 +481,7 @@ class WindowManager(QObject):
                     )
                 ]
         except Exception as e:
-            print(f"Main display fallback failed: {e}")
+            log.warning("Main display fallback failed: %s", e)
 
         # Ultimate fallback - assume standard resolution
         return [
@@ -244,7 +496,66 @@ class WindowManager(QObject):
             )
         ]
 
+    def _register_reconfiguration_callback(self) -> None:
+        """Drop the display cache the moment the screen topology changes"""
+        try:
+            def _on_display_reconfigure(display, flags, _info):
+                self._cached_displays = None
+                try:
+                    self._main_display_id = Quartz.CGMainDisplayID()
+                except Exception:
+                    pass
+
+            # Keep a reference so the callback outlives this frame
+            self._reconfigure_cb = _on_display_reconfigure
+            Quartz.CGDisplayRegisterReconfigurationCallback(
+                _on_display_reconfigure, None
+            )
+        except Exception:
+            self._reconfigure_cb = None
+        # The Qt screen list can update a beat before or after the Quartz
+        # callback; hook its signals too so whichever path enumerated the
+        # displays is invalidated promptly
+        try:
+            app = QApplication.instance()
+            if app is not None:
+                app.screenAdded.connect(self._on_screen_added)
+                app.screenRemoved.connect(self._invalidate_displays)
+                for screen in app.screens():
+                    screen.geometryChanged.connect(self._invalidate_displays)
+        except Exception:
+            pass
+
+    def _on_screen_added(self, screen) -> None:
+        try:
+            screen.geometryChanged.connect(self._invalidate_displays)
+        except Exception:
+            pass
+        self._invalidate_displays()
+
+    def _invalidate_displays(self, *_args) -> None:
+        self._cached_displays = None
+
     def get_displays(self) -> list[DisplayInfo]:
+        cached = self._cached_displays
+        if (
+            cached is not None
+            and (time.monotonic() - self._displays_cache_ts) < _DISPLAY_CACHE_TTL
+        ):
+            return cached
+        displays = self._enumerate_displays()
+        self._cached_displays = displays
+        # Flat (x0, y0, x1, y1, id) tuples for the per-window hit-test;
+        # built once here so the loop unpacks locals instead of touching
+        # five dataclass attributes per display per window
+        self._cached_rects = tuple(
+            (d.x, d.y, d.x + d.width, d.y + d.height, d.display_id)
+            for d in displays
+        )
+        self._displays_cache_ts = time.monotonic()
+        return displays
+
+    def _enumerate_displays(self) -> list[DisplayInfo]:
         app = QApplication.instance()
         if app:
             screens = app.screens()
@@ -269,7 +580,13 @@ class WindowManager(QObject):
         try:
             max_displays = 32
             count = Quartz.CGDisplayCount
-            online_displays = (Quartz.CGDirectDisplayID * max_displays)()
+            # Reuse one output buffer across enumerations; cache misses
+            # shouldn't pay a fresh ctypes array allocation each time
+            online_displays = self._displays_buf
+            if online_displays is None:
+                online_displays = self._displays_buf = (
+                    Quartz.CGDirectDisplayID * max_displays
+                )()
             result = Quartz.CGGetOnlineDisplayList(max_displays, online_displays, count)
             if result != 0:
                 return self._get_main_display_fallback()
@@ -287,184 +604,337 @@ class WindowManager(QObject):
                         height=int(bounds.size.height),
                         x=int(bounds.origin.x),
                         y=int(bounds.origin.y),
-                        is_main=(did == Quartz.CGMainDisplayID()),
+                        is_main=(did == self._main_display_id),
                     )
                 )
             return displays if displays else self._get_main_display_fallback()
         except Exception:
             return self._get_main_display_fallback()
 
-    def get_running_apps(self) -> list[dict[str, Any]]:
+    def get_running_apps(self) -> list[RunningApp]:
         """Get list of running applications"""
-        apps = []
-        running_apps = self.workspace.runningApplications()
-
-        for app in running_apps:
+        apps: list[RunningApp] = []
+        frontmost = self.workspace.frontmostApplication()
+        intern = sys.intern
+        for app in self._pid_app_map().values():
             if app.activationPolicy() == 0:  # Regular apps only
                 apps.append(
-                    {
-                        "name": app.localizedName(),
-                        "bundle_id": app.bundleIdentifier(),
-                        "pid": app.processIdentifier(),
-                        "is_hidden": app.isHidden(),
-                        "is_active": self.workspace.frontmostApplication() == app,
-                    }
+                    RunningApp(
+                        name=intern(str(app.localizedName() or "")),
+                        bundle_id=intern(str(app.bundleIdentifier() or "")),
+                        pid=app.processIdentifier(),
+                        is_hidden=bool(app.isHidden()),
+                        is_active=app == frontmost,
+                    )
+                )
+        return apps
+
+    def _register_app_list_observers(self) -> None:
+        """Drop the pid->app cache when apps launch or terminate"""
+        try:
+            from AppKit import (
+                NSWorkspaceDidLaunchApplicationNotification,
+                NSWorkspaceDidTerminateApplicationNotification,
+            )
+
+            center = self.workspace.notificationCenter()
+
+            def _invalidate(_note):
+                self._apps_by_pid = None
+
+            for name in (
+                NSWorkspaceDidLaunchApplicationNotification,
+                NSWorkspaceDidTerminateApplicationNotification,
+            ):
+                token = center.addObserverForName_object_queue_usingBlock_(
+                    name, None, None, _invalidate
                 )
+                self._observer_tokens.append(token)
+        except Exception:
+            # Without observers the TTL alone keeps the cache honest
+            pass
+
+    def _pid_app_map(self) -> dict[int, Any]:
+        """pid -> NSRunningApplication for every running app, cached
 
+        The same pass also indexes apps by localized name and bundle id
+        so name/bundle resolution is a dict lookup rather than a linear
+        scan; all three maps share the cache lifetime.
+        """
+        apps = self._apps_by_pid
+        if (
+            apps is not None
+            and (time.monotonic() - self._apps_cache_ts) < _APP_CACHE_TTL
+        ):
+            return apps
+        apps = {}
+        by_name: dict[str, Any] = {}
+        by_bundle: dict[str, Any] = {}
+        for app in self.workspace.runningApplications():
+            apps[app.processIdentifier()] = app
+            name = app.localizedName()
+            if name and name not in by_name:
+                by_name[name] = app
+            bid = app.bundleIdentifier()
+            if bid and bid not in by_bundle:
+                by_bundle[bid] = app
+        self._apps_by_pid = apps
+        self._apps_by_name = by_name
+        self._apps_by_bundle = by_bundle
+        self._apps_cache_ts = time.monotonic()
         return apps
 
-    def get_windows(self, app_name: str | None = None) -> list[WindowInfo]:
-        """Get information about all windows or windows from specific app"""
-        windows = []
+    def _find_app_by_pid(self, pid: int) -> Any | None:
+        return self._pid_app_map().get(pid)
+
+    def _find_app_by_name_or_bundle(
+        self, app_name: str | None, bundle_id: str | None
+    ) -> Any | None:
+        """Resolve an app ref by bundle id first, localized name second"""
+        self._pid_app_map()  # (re)build the indexes if stale
+        app = self._apps_by_bundle.get(bundle_id) if bundle_id else None
+        if app is None and app_name:
+            app = self._apps_by_name.get(app_name)
+        return app
+
+    def _pids_for_app_name(self, app_name: str | None) -> set[int]:
+        """Resolve an app name to the pids that own it, for prefiltering"""
+        if not app_name:
+            return set()
+        try:
+            return {
+                pid
+                for pid, app in self._pid_app_map().items()
+                if app.localizedName() == app_name
+            }
+        except Exception:
+            return set()
+
+    def _capture_app_maps(self) -> tuple[dict[int, Any], dict[int, bool]]:
+        """One pass over runningApplications for the per-pid data a
+        capture needs
 
+        The old path called get_running_apps() once per window, which is
+        O(windows x apps) ObjC crossings for data that cannot change
+        mid-capture.
+        """
+        bundle_by_pid: dict[int, Any] = {}
+        hidden_by_pid: dict[int, bool] = {}
+        # Iterate the cached pid map rather than asking the workspace for
+        # a fresh NSArray; isHidden is read live off each app ref, so the
+        # hidden state is current even when the map itself is cached
+        for pid, app in self._pid_app_map().items():
+            if app.activationPolicy() == 0:  # Regular apps only
+                bundle_by_pid[pid] = app.bundleIdentifier()
+                hidden_by_pid[pid] = bool(app.isHidden())
+        return bundle_by_pid, hidden_by_pid
+
+    def get_windows(
+        self, app_name: str | None = None, skip_unnamed: bool = False
+    ) -> list[WindowInfo]:
+        """Get information about all windows or windows from specific app
+
+        skip_unnamed drops windows that publish no title (background
+        utilities, some Finder windows) before any further per-window
+        work.
+        """
         if not self._permissions_granted:
-            print("Warning: Insufficient permissions to access window information")
-            return windows
+            log.warning("Insufficient permissions to access window information")
+            return []
+        # Per-window emission pays meta-object dispatch in the hot loop;
+        # skip it entirely when nothing is connected
+        emit_each = self.receivers(self.window_captured) > 0
+        windows = self._windows_from_cg_list(
+            _WINDOW_LIST_OPTS, app_name, skip_unnamed, emit_each
+        )
+        self.windows_captured.emit(windows)
+        return windows
 
+    def _windows_from_cg_list(
+        self,
+        options: int,
+        app_name: str | None,
+        skip_unnamed: bool,
+        emit_each: bool,
+    ) -> list[WindowInfo]:
+        """Shared capture pipeline behind get_windows / get_windows_all_spaces
+
+        Owns the CGWindowListCopyWindowInfo call, the space mapping and
+        the per-window filter loop; callers differ only in the window
+        list option mask. Back-to-back identical calls within a short
+        window are served from a micro-cache so double captures (e.g. a
+        snapshot save that wants both on-screen and all-space views) pay
+        Quartz once.
+        """
+        windows: list[WindowInfo] = []
+
+        cache_key = (options, app_name, skip_unnamed)
+        if not emit_each:
+            cached = self._capture_cache.get(cache_key)
+            if cached is not None and (time.monotonic() - cached[0]) < _CAPTURE_CACHE_TTL:
+                return cached[1]
+
+        # CGWindowListCopyWindowInfo hands back an autoreleased CF array;
+        # under a long-lived Qt event loop no pool ever drains, so each
+        # capture would pin the previous array. A local pool scoped to
+        # this call reclaims it immediately.
+        pool = NSAutoreleasePool.alloc().init()
         try:
-            apps = self.get_running_apps()
-            bundle_by_pid = {a["pid"]: a.get("bundle_id") for a in apps}
+            bundle_by_pid, hidden_by_pid = self._capture_app_maps()
+            # Targeted captures resolve the app name to pids up front so
+            # the loop compares integers instead of strings per window
+            target_pids = self._pids_for_app_name(app_name)
             window_list = Quartz.CGWindowListCopyWindowInfo(
-                Quartz.kCGWindowListOptionOnScreenOnly
-                | Quartz.kCGWindowListExcludeDesktopElements,
-                Quartz.kCGNullWindowID,
+                options, Quartz.kCGNullWindowID
             )
 
+            # Let the compiled predicate discard menu-bar items, the Dock
+            # and other system windows before Python iterates; the
+            # in-loop checks stay as the fallback when this fails
+            if window_list and self._window_predicate is not None:
+                try:
+                    window_list = window_list.filteredArrayUsingPredicate_(
+                        self._window_predicate
+                    )
+                except Exception:
+                    pass
+
             if window_list:
-                mapping = self._window_to_space_map()
+                # Targeted captures are the restore-path polling case and
+                # never consume space_id; skip the SkyLight walk — the
+                # most expensive stage of the pipeline — entirely
+                mapping = {} if app_name else self._window_to_space_map()
+                displays = self.get_displays()
+                # Every early-out below is an ordinary predicate on a
+                # defensive .get(); the loop body carries no per-window
+                # try/except frame. A genuinely unexpected failure falls
+                # through to the outer handler like any other.
+                intern = sys.intern
                 for window in window_list:
-                    try:
-                        # Skip system windows
-                        window_layer = window.get(Quartz.kCGWindowLayer, 0)
-                        if window_layer != 0:
-                            continue
-
-                        # Get window properties
-                        owner_name = window.get(Quartz.kCGWindowOwnerName, "")
-                        window_name = window.get(Quartz.kCGWindowName, "")
-                        pid = window.get(Quartz.kCGWindowOwnerPID, 0)
-                        wid = window.get(Quartz.kCGWindowNumber, 0)
+                    # Skip system windows
+                    if window.get(_K_LAYER, 0) != 0:
+                        continue
 
-                        # Skip empty or system windows
-                        if not owner_name or owner_name in ["Window Server", "Dock"]:
+                    # Cheap filters run first, each fetching only the
+                    # field it needs; rejected windows never pay for the
+                    # remaining lookups or construction
+                    owner_name = window.get(_K_OWNER, "")
+                    if not owner_name or owner_name in _SKIP_OWNERS:
+                        continue
+                    # The same few app names repeat across every window
+                    # and every capture; interning (via exact str — the
+                    # bridge returns str subclasses) makes downstream
+                    # grouping keys and name compares identity-fast
+                    owner_name = intern(str(owner_name))
+
+                    pid = window.get(_K_PID, 0)
+
+                    # Filter by app name if specified; pid compare when
+                    # the name resolved, string compare otherwise
+                    if app_name:
+                        if target_pids:
+                            if pid not in target_pids:
+                                continue
+                        elif owner_name != app_name:
                             continue
 
-                        # Filter by app name if specified
-                        if app_name and owner_name != app_name:
-                            continue
+                    window_name = window.get(_K_NAME, "")
+                    if skip_unnamed and not window_name:
+                        continue
 
-                        # Get window bounds
-                        bounds = window.get(Quartz.kCGWindowBounds, {})
-                        if not bounds:
-                            continue
+                    bounds = window.get(_K_BOUNDS)
+                    if not bounds:
+                        continue
 
-                        x = bounds.get("X", 0)
-                        y = bounds.get("Y", 0)
-                        width = bounds.get("Width", 0)
-                        height = bounds.get("Height", 0)
+                    bget = bounds.get
+                    x = bget("X", 0)
+                    y = bget("Y", 0)
+                    width = bget("Width", 0)
+                    height = bget("Height", 0)
 
-                        # Skip invalid windows
-                        if width <= 0 or height <= 0:
-                            continue
+                    # Skip invalid windows
+                    if width <= 0 or height <= 0:
+                        continue
 
-                        display_id = self._get_display_for_window(x, y, width, height)
-
-                        # Check if window is minimized (this is approximate)
-                        is_minimized = self._is_window_minimized(pid, window_name)
-                        bundle_id = bundle_by_pid.get(pid)
-
-                        window_info = WindowInfo(
-                            app_name=owner_name,
-                            window_title=window_name,
-                            x=x,
-                            y=y,
-                            width=width,
-                            height=height,
-                            is_minimized=is_minimized,
-                            is_hidden=False,  # Will be determined by app state
-                            display_id=display_id,
-                            pid=pid,
-                            bundle_id=bundle_id,
-                            space_id=mapping.get(int(wid)) if mapping else None,
-                            window_id=int(wid) if wid else None,
-                        )
+                    # All filters passed; now do the cross-API work
+                    wid = window.get(_K_NUMBER, 0)
+                    display_id = self._get_display_for_window(
+                        x, y, width, height, displays
+                    )
 
-                        windows.append(window_info)
-                        self.window_captured.emit(window_info)
+                    # Hidden-app state stands in for minimized (this is
+                    # approximate)
+                    window_info = WindowInfo(
+                        app_name=owner_name,
+                        window_title=window_name,
+                        x=x,
+                        y=y,
+                        width=width,
+                        height=height,
+                        is_minimized=hidden_by_pid.get(pid, False),
+                        is_hidden=False,  # Will be determined by app state
+                        display_id=display_id,
+                        pid=pid,
+                        bundle_id=bundle_by_pid.get(pid),
+                        space_id=mapping.get(int(wid)) if mapping else None,
+                        window_id=int(wid) if wid else None,
+                    )
 
-                    except Exception as e:
-                        print(f"Error processing window: {e}")
-                        continue
+                    windows.append(window_info)
+                    if emit_each:
+                        self.window_captured.emit(window_info)
 
         except Exception as e:
-            print(f"Error getting window list: {e}")
+            log.warning("Error getting window list: %s", e)
             return windows
+        finally:
+            del pool
 
+        self._capture_cache[cache_key] = (time.monotonic(), windows)
         return windows
 
+    def capture_async(self, app_name: str | None = None) -> None:
+        """Run a capture on the shared thread pool
+
+        Results arrive through the windows_captured signal; cross-thread
+        emission is queued by Qt, so slots run on their own event loop
+        and must not touch Quartz directly. Requests issued while one is
+        in flight are dropped — the pending pass is already fresh enough.
+        """
+        if self._capture_inflight:
+            return
+        self._capture_inflight = True
+        QThreadPool.globalInstance().start(_CaptureTask(self, app_name))
+
     def get_windows_all_spaces(self, app_name: str | None = None) -> list[WindowInfo]:
-        windows = []
         if not self._permissions_granted:
-            return windows
-        try:
-            apps = self.get_running_apps()
-            bundle_by_pid = {a["pid"]: a.get("bundle_id") for a in apps}
-            window_list = Quartz.CGWindowListCopyWindowInfo(
-                Quartz.kCGWindowListOptionAll | Quartz.kCGWindowListExcludeDesktopElements,
-                Quartz.kCGNullWindowID,
+            return []
+        return self._windows_from_cg_list(
+            _WINDOW_LIST_ALL_OPTS, app_name, False, False
+        )
+
+    def _get_display_for_window(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        displays: list[DisplayInfo] | None = None,
+    ) -> int:
+        # Capture loops pass the display list they already fetched so the
+        # per-window call never re-enumerates
+        if displays is None:
+            displays = self.get_displays()
+
+        # Use the precomputed flat rects when the caller handed us the
+        # cached list; otherwise derive them for this call
+        if displays is self._cached_displays and self._cached_rects is not None:
+            rects = self._cached_rects
+        else:
+            rects = tuple(
+                (d.x, d.y, d.x + d.width, d.y + d.height, d.display_id)
+                for d in displays
             )
-            mapping = self._window_to_space_map()
-            if window_list:
-                for window in window_list:
-                    try:
-                        window_layer = window.get(Quartz.kCGWindowLayer, 0)
-                        if window_layer != 0:
-                            continue
-                        owner_name = window.get(Quartz.kCGWindowOwnerName, "")
-                        window_name = window.get(Quartz.kCGWindowName, "")
-                        pid = window.get(Quartz.kCGWindowOwnerPID, 0)
-                        wid = window.get(Quartz.kCGWindowNumber, 0)
-                        if not owner_name or owner_name in ["Window Server", "Dock"]:
-                            continue
-                        if app_name and owner_name != app_name:
-                            continue
-                        bounds = window.get(Quartz.kCGWindowBounds, {})
-                        if not bounds:
-                            continue
-                        x = bounds.get("X", 0)
-                        y = bounds.get("Y", 0)
-                        width = bounds.get("Width", 0)
-                        height = bounds.get("Height", 0)
-                        if width <= 0 or height <= 0:
-                            continue
-                        display_id = self._get_display_for_window(x, y, width, height)
-                        is_minimized = self._is_window_minimized(pid, window_name)
-                        bundle_id = bundle_by_pid.get(pid)
-                        windows.append(
-                            WindowInfo(
-                                app_name=owner_name,
-                                window_title=window_name,
-                                x=x,
-                                y=y,
-                                width=width,
-                                height=height,
-                                is_minimized=is_minimized,
-                                is_hidden=False,
-                                display_id=display_id,
-                                pid=pid,
-                                bundle_id=bundle_id,
-                                space_id=mapping.get(int(wid)) if mapping else None,
-                                window_id=int(wid) if wid else None,
-                            )
-                        )
-                    except Exception:
-                        continue
-        except Exception:
-            return windows
-        return windows
-
-    def _get_display_for_window(self, x: int, y: int, width: int, height: int) -> int:
-        displays = self.get_displays()
 
         win_min_x = x
         win_max_x = x + width
@@ -474,12 +944,7 @@ class WindowManager(QObject):
         best_display_id = None
         best_area = -1
 
-        for display in displays:
-            disp_min_x = display.x
-            disp_max_x = display.x + display.width
-            disp_min_y = display.y
-            disp_max_y = display.y + display.height
-
+        for disp_min_x, disp_min_y, disp_max_x, disp_max_y, display_id in rects:
             inter_w = min(win_max_x, disp_max_x) - max(win_min_x, disp_min_x)
             inter_h = min(win_max_y, disp_max_y) - max(win_min_y, disp_min_y)
 
@@ -487,31 +952,18 @@ class WindowManager(QObject):
                 area = inter_w * inter_h
                 if area > best_area:
                     best_area = area
-                    best_display_id = display.display_id
+                    best_display_id = display_id
 
         if best_display_id is not None:
             return best_display_id
 
         cx = x + (width // 2)
         cy = y + (height // 2)
-        for display in displays:
-            if (
-                display.x <= cx < display.x + display.width
-                and display.y <= cy < display.y + display.height
-            ):
-                return display.display_id
-
-        return Quartz.CGMainDisplayID()
-
-    def _is_window_minimized(self, pid: int, window_title: str) -> bool:
-        """Check if a window is minimized (approximate method)"""
-        # This is a simplified check - in reality, this is complex on macOS
-        # For now, we'll check if the app is hidden
-        apps = self.get_running_apps()
-        for app in apps:
-            if app["pid"] == pid:
-                return app["is_hidden"]
-        return False
+        for disp_min_x, disp_min_y, disp_max_x, disp_max_y, display_id in rects:
+            if disp_min_x <= cx < disp_max_x and disp_min_y <= cy < disp_max_y:
+                return display_id
+
+        return self._main_display_id or Quartz.CGMainDisplayID()
 
     def restore_window(self, window_info: WindowInfo) -> bool:
         """Restore a window to its captured state"""
@@ -520,8 +972,8 @@ class WindowManager(QObject):
             # First, try to bring the app to front
             self._activate_app(window_info.pid)
 
-            # Wait a moment for the app to become active
-            time.sleep(0.1)
+            # Wait for the app to report active instead of a fixed sleep
+            self._wait_for_activation(window_info.pid)
 
             # Move and resize the window
             self._move_window(
@@ -541,70 +993,328 @@ class WindowManager(QObject):
             return True
 
         except Exception as e:
-            print(f"Error restoring window {window_info.app_name}: {e}")
+            log.warning("Error restoring window %s: %s", window_info.app_name, e)
             try:
                 reason = str(e) if str(e) else "restore_error"
                 self.window_restore_failed.emit(window_info.app_name, window_info.window_title, reason)
-            except Exception:
+            except RuntimeError:
                 pass
             return False
 
+    def _make_ax_window_waiter(self, app_name: str):
+        """Observer-backed waiter for an app's first window
+
+        Returns a callable that blocks on the calling thread's run loop
+        until kAXWindowCreatedNotification fires for the app (or the
+        given slice elapses), or None when the observer cannot be set
+        up — no pids resolved yet, AX not permitted, or the bridge
+        missing.
+        """
+        from ApplicationServices import (
+            AXObserverAddNotification,
+            AXObserverCreate,
+            AXObserverGetRunLoopSource,
+            AXObserverRemoveNotification,
+            AXUIElementCreateApplication,
+            kAXWindowCreatedNotification,
+        )
+        from CoreFoundation import (
+            CFRunLoopAddSource,
+            CFRunLoopGetCurrent,
+            CFRunLoopRemoveSource,
+            CFRunLoopRunInMode,
+            kCFRunLoopDefaultMode,
+        )
+
+        pids = self._pids_for_app_name(app_name)
+        if not pids:
+            return None
+        pid = next(iter(pids))
+
+        def _on_window_created(_observer, _element, _notification, _refcon):
+            # Waking the run loop is all that's needed; the caller
+            # re-checks get_windows after every wake
+            pass
+
+        err, observer = AXObserverCreate(pid, _on_window_created, None)
+        if err != 0 or observer is None:
+            return None
+        app_element = AXUIElementCreateApplication(pid)
+        AXObserverAddNotification(
+            observer, app_element, kAXWindowCreatedNotification, None
+        )
+        source = AXObserverGetRunLoopSource(observer)
+        run_loop = CFRunLoopGetCurrent()
+        CFRunLoopAddSource(run_loop, source, kCFRunLoopDefaultMode)
+
+        def _pump(slice_seconds: float) -> None:
+            CFRunLoopRunInMode(kCFRunLoopDefaultMode, slice_seconds, True)
+
+        def _close() -> None:
+            # Undo the registration in reverse order; without this every
+            # wait leaked an observer source into the thread's run loop
+            try:
+                AXObserverRemoveNotification(
+                    observer, app_element, kAXWindowCreatedNotification
+                )
+            except Exception:
+                pass
+            try:
+                CFRunLoopRemoveSource(run_loop, source, kCFRunLoopDefaultMode)
+            except Exception:
+                pass
+
+        # Keep the observer, element and source alive as long as the
+        # waiter; close() detaches them from the run loop when done
+        _pump._refs = (observer, app_element, source)
+        _pump.close = _close
+        return _pump
+
+    def _wait_for_app_window(self, app_name: str, timeout: float = 30.0):
+        """Wait for an app to publish its first window
+
+        With an AX observer the wait is event-driven: the run loop wakes
+        on window creation and the targeted capture confirms it. Without
+        one (AX denied, app not resolvable) this degrades to the old
+        sleep-and-poll cadence. Each check is a targeted
+        get_windows(app_name), never a full desktop scan.
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            waiter = self._make_ax_window_waiter(app_name)
+        except Exception:
+            waiter = None
+        # Start fast so quick-launching apps return on the first tick,
+        # back off towards half a second while a slow one starts up
+        interval = 0.05
+        pids: set[int] = set()
+        try:
+            while time.monotonic() < deadline:
+                if waiter is not None:
+                    waiter(0.25)
+                else:
+                    time.sleep(interval)
+                    interval = min(interval * 1.3, 0.5)
+                # Once the pid is known, a scoped AX probe answers "any
+                # window yet?" without a window-list capture; the
+                # capture runs only to build the WindowInfo when one
+                # exists (or as the fallback when AX cannot answer)
+                if not pids:
+                    pids = self._pids_for_app_name(app_name)
+                if pids:
+                    probes = [self._ax_window_count(pid) for pid in pids]
+                    if all(count == 0 for count in probes):
+                        continue
+                current = self.get_windows(app_name)
+                if current:
+                    return current[0]
+            return None
+        finally:
+            # Tear the observer out of the run loop regardless of how
+            # the wait ended
+            if waiter is not None:
+                try:
+                    waiter.close()
+                except Exception:
+                    pass
+
+    def _ax_window_count(self, pid: int) -> int | None:
+        """Number of AX windows an app publishes; None when AX can't say"""
+        try:
+            from ApplicationServices import (
+                AXUIElementCopyAttributeValue,
+                AXUIElementCreateApplication,
+                kAXWindowsAttribute,
+            )
+
+            err, ax_windows = AXUIElementCopyAttributeValue(
+                AXUIElementCreateApplication(pid), kAXWindowsAttribute, None
+            )
+            if err != 0:
+                return None
+            return len(ax_windows) if ax_windows else 0
+        except Exception:
+            return None
+
+    def _wait_for_activation(self, pid: int, timeout: float = 0.1, app=None) -> None:
+        """Wait until an activated app reports active, up to timeout
+
+        The old fixed 100ms sleep serialized to N x 100ms on batch
+        restores; polling isActive in 10ms steps returns as soon as
+        activation actually lands. Callers that already hold the
+        NSRunningApplication pass it in to skip the pid lookup.
+        """
+        if app is None:
+            app = self._find_app_by_pid(pid)
+        if app is None:
+            time.sleep(timeout)
+            return
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if app.isActive():
+                    return
+            except Exception:
+                break
+            time.sleep(0.01)
+
+    def _activate_app_ref(self, app) -> None:
+        """Activate an already-resolved NSRunningApplication"""
+        if app is not None and not app.isActive():
+            app.activateWithOptions_(0)  # NSApplicationActivateIgnoringOtherApps
+
     def _activate_app(self, pid: int) -> None:
         """Activate (bring to front) an application by PID"""
-        apps = self.workspace.runningApplications()
-        for app in apps:
-            if app.processIdentifier() == pid:
-                app.activateWithOptions_(0)  # NSApplicationActivateIgnoringOtherApps
-                break
+        self._activate_app_ref(self._find_app_by_pid(pid))
+
+    @staticmethod
+    def _move_commands(
+        pid: int, x: int, y: int, width: int, height: int, title: str | None = None
+    ) -> str:
+        """System Events commands to place one window, for batching"""
+        target = (
+            f"set position of (first window whose name is \"{title}\") to {{{x}, {y}}}\n"
+            f"set size of (first window whose name is \"{title}\") to {{{width}, {height}}}"
+            if title
+            else f"set position of window 1 to {{{x}, {y}}}\nset size of window 1 to {{{width}, {height}}}"
+        )
+        return (
+            f"tell (first application process whose unix id is {pid})\n"
+            f"try\n{target}\nend try\nend tell"
+        )
+
+    def _run_applescript(self, source: str) -> None:
+        """Execute AppleScript in-process via NSAppleScript
+
+        Spawning osascript costs a fork plus ScriptingBridge init per
+        invocation; NSAppleScript keeps the call inside this process.
+        The subprocess path remains as a fallback.
+        """
+        try:
+            from Foundation import NSAppleScript
 
-    def _move_window(self, pid: int, x: int, y: int, width: int, height: int, title: str | None = None) -> None:
-        """Move and resize a window"""
-        # This is a simplified implementation
-        # In a real implementation, you would need to find the specific window
-        # and use AppleScript or Accessibility APIs to move it
+            script = NSAppleScript.alloc().initWithSource_(source)
+            script.executeAndReturnError_(None)
+        except Exception:
+            subprocess.run(["osascript", "-e", source], check=False)
+
+    def _ax_move_window(
+        self, pid: int, x: int, y: int, width: int, height: int, title: str | None = None
+    ) -> bool:
+        """Place a window through the Accessibility API
 
-        # For now, we'll use a basic approach
+        Sub-millisecond in-process C calls instead of compiling and
+        executing AppleScript. Returns False when AX is unavailable or
+        the window cannot be found so callers can fall back.
+        """
         try:
-            target = (
-                f"set position of (first window whose name is \"{title}\") to {{{x}, {y}}}\n"
-                f"set size of (first window whose name is \"{title}\") to {{{width}, {height}}}"
-                if title
-                else f"set position of window 1 to {{{x}, {y}}}\nset size of window 1 to {{{width}, {height}}}"
+            from ApplicationServices import (
+                AXUIElementCopyAttributeValue,
+                AXUIElementCreateApplication,
+                AXUIElementSetAttributeValue,
+                AXValueCreate,
+                kAXPositionAttribute,
+                kAXSizeAttribute,
+                kAXTitleAttribute,
+                kAXValueCGPointType,
+                kAXValueCGSizeType,
+                kAXWindowsAttribute,
             )
-            script = (
-                "tell application \"System Events\"\n"
-                f"tell (first application process whose unix id is {pid})\n"
-                f"try\n{target}\nend try\nend tell\nend tell"
+
+            app_element = AXUIElementCreateApplication(pid)
+            err, ax_windows = AXUIElementCopyAttributeValue(
+                app_element, kAXWindowsAttribute, None
             )
-            subprocess.run(["osascript", "-e", script], check=False)
+            if err != 0 or not ax_windows:
+                return False
+            target = None
+            if title:
+                for ax_window in ax_windows:
+                    werr, wtitle = AXUIElementCopyAttributeValue(
+                        ax_window, kAXTitleAttribute, None
+                    )
+                    if werr == 0 and wtitle == title:
+                        target = ax_window
+                        break
+            if target is None:
+                target = ax_windows[0]
+            position = AXValueCreate(kAXValueCGPointType, Quartz.CGPoint(x, y))
+            size = AXValueCreate(kAXValueCGSizeType, Quartz.CGSize(width, height))
+            AXUIElementSetAttributeValue(target, kAXPositionAttribute, position)
+            AXUIElementSetAttributeValue(target, kAXSizeAttribute, size)
+            return True
+        except Exception:
+            return False
+
+    def _batch_move_windows(
+        self, moves: list[tuple[int, int, int, int, int, str | None]]
+    ) -> None:
+        """Place several windows, preferring the AX fast path
+
+        Whatever AX could not handle is swept up by a single System
+        Events script rather than one per window.
+        """
+        if not moves:
+            return
+        fallback = [move for move in moves if not self._ax_move_window(*move)]
+        if fallback:
+            body = "\n".join(self._move_commands(*move) for move in fallback)
+            self._run_applescript(
+                f"tell application \"System Events\"\n{body}\nend tell"
+            )
+
+    def _move_window(self, pid: int, x: int, y: int, width: int, height: int, title: str | None = None) -> None:
+        """Move and resize a window"""
+        try:
+            self._batch_move_windows([(pid, x, y, width, height, title)])
         except Exception as e:
-            print(f"Error moving window: {e}")
+            log.warning("Error moving window: %s", e)
 
     def _minimize_window(self, pid: int, minimize: bool) -> None:
         """Minimize or restore a window"""
         try:
-            apps = self.workspace.runningApplications()
-            for app in apps:
-                if app.processIdentifier() == pid:
-                    if minimize:
-                        app.hide()
-                    else:
-                        app.unhide()
-                    break
+            app = self._find_app_by_pid(pid)
+            if app is not None:
+                if minimize:
+                    app.hide()
+                else:
+                    app.unhide()
         except Exception as e:
-            print(f"Error minimizing/restoring window: {e}")
+            log.warning("Error minimizing/restoring window: %s", e)
+
+    def _resolve_bundle_url(self, bundle_id: str) -> Any | None:
+        """App URL for a bundle id, memoized for the session
+
+        URLForApplicationWithBundleIdentifier_ is a LaunchServices
+        database query and apps do not move while we run; only
+        successful lookups are cached, so an app installed mid-session
+        is still found on the next attempt.
+        """
+        url = _BUNDLE_URL_CACHE.get(bundle_id)
+        if url is None:
+            url = self.workspace.URLForApplicationWithBundleIdentifier_(bundle_id)
+            if url:
+                _BUNDLE_URL_CACHE[bundle_id] = url
+        return url
+
+    def clear_caches(self) -> None:
+        """Drop every session cache; the next call of each path rebuilds"""
+        _BUNDLE_URL_CACHE.clear()
+        self._capture_cache.clear()
+        self._cached_displays = None
+        self._apps_by_pid = None
 
     def launch_app(self, bundle_id: str) -> bool:
         """Launch an application by bundle ID"""
         try:
-            app_url = self.workspace.URLForApplicationWithBundleIdentifier_(bundle_id)
+            app_url = self._resolve_bundle_url(bundle_id)
             if app_url:
                 return self.workspace.launchApplicationAtURL_options_configuration_(
                     app_url, 0, None
                 )[0]
             return False
         except Exception as e:
-            print(f"Error launching app {bundle_id}: {e}")
+            log.warning("Error launching app %s: %s", bundle_id, e)
             return False
 
     def launch_app_by_name(self, app_name: str) -> tuple[bool, str]:
@@ -627,7 +1337,7 @@ class WindowManager(QObject):
             self.window_launch_result.emit(app_name, False, "launch_failed")
             return False, "launch_failed"
         except Exception as e:
-            print(f"Error launching app {app_name}: {e}")
+            log.warning("Error launching app %s: %s", app_name, e)
             try:
                 self.window_launch_result.emit(app_name, False, str(e) if str(e) else "error")
             except Exception:
@@ -635,24 +1345,35 @@ class WindowManager(QObject):
             return False, "error"
 
     def launch_app_prefer_info(self, app_name: str, bundle_id: str | None) -> tuple[bool, str]:
+        # Remember which strategy worked for this app so later launches
+        # (several windows of one app, repeated restores) skip the
+        # attempts that already failed once this session
+        key = (app_name, bundle_id)
+        method = self._launch_method_cache.get(key)
         try:
-            if bundle_id:
+            if bundle_id and method in (None, "bundle"):
                 self.window_launch_attempt.emit(app_name, f"bundle '{bundle_id}' via NSWorkspace")
                 ok = self.launch_app(bundle_id)
                 if ok:
+                    self._launch_method_cache[key] = "bundle"
                     self.window_launch_result.emit(app_name, True, "bundle_id")
                     return True, f"bundle '{bundle_id}' via NSWorkspace"
+            if bundle_id and method in (None, "open -b"):
                 self.window_launch_attempt.emit(app_name, f"open -b {bundle_id}")
                 try:
                     subprocess.run(["open", "-b", bundle_id], check=False)
+                    self._launch_method_cache[key] = "open -b"
                     self.window_launch_result.emit(app_name, True, "open -b")
                     return True, f"open -b {bundle_id}"
                 except Exception:
                     pass
             # Fallback to name-based
-            return self.launch_app_by_name(app_name)
+            ok, cmd = self.launch_app_by_name(app_name)
+            if ok:
+                self._launch_method_cache[key] = "name"
+            return ok, cmd
         except Exception as e:
-            print(f"Error launching app {app_name} (prefer bundle): {e}")
+            log.warning("Error launching app %s (prefer bundle): %s", app_name, e)
             try:
                 self.window_launch_result.emit(app_name, False, str(e) if str(e) else "error")
             except Exception:
@@ -662,118 +1383,222 @@ class WindowManager(QObject):
     def quit_app(self, bundle_id: str) -> bool:
         """Quit an application by bundle ID"""
         try:
-            apps = self.workspace.runningApplications()
-            for app in apps:
+            for app in self._pid_app_map().values():
                 if app.bundleIdentifier() == bundle_id:
                     app.terminate()
                     return True
             return False
         except Exception as e:
-            print(f"Error quitting app {bundle_id}: {e}")
+            log.warning("Error quitting app %s: %s", bundle_id, e)
             return False
 
-    def restore_layout(self, snapshot) -> bool:
+    @staticmethod
+    def _geometry_differs(chosen: WindowInfo, w, tol: int = 2) -> bool:
+        """True when chosen sits more than tol pixels off the target
+
+        Signed compares instead of abs(): the builtin call per axis adds
+        up in the common re-restore case where nothing differs, and the
+        short-circuit per axis is kept.
+        """
+        d = chosen.x - w.x
+        if d > tol or -d > tol:
+            return True
+        d = chosen.y - w.y
+        if d > tol or -d > tol:
+            return True
+        d = chosen.width - w.width
+        if d > tol or -d > tol:
+            return True
+        d = chosen.height - w.height
+        return d > tol or -d > tol
+
+    def _restore_present_window(self, w, chosen: WindowInfo, pending_moves: list) -> None:
+        """Apply one snapshot window's state to an already-present window
+
+        Runs the unhide/activate/wait/unminimize sequence only when at
+        least one of those side effects is actually needed; geometry
+        changes are deferred into pending_moves for the caller's single
+        batched move script.
+        """
+        wx, wy, ww, wh = w.x, w.y, w.width, w.height
+        need_move = self._geometry_differs(chosen, w)
+        app_ref = self._find_app_by_pid(chosen.pid)
         try:
-            # First, hide all other running apps to keep the desktop focused on this profile
-            self._hide_non_profile_apps(snapshot)
+            hidden = bool(app_ref is not None and app_ref.isHidden())
+        except Exception:
+            hidden = False
+        # Already placed, visible and not minimized: true no-op
+        if need_move or w.is_minimized or hidden:
+            try:
+                self._unhide_app_by_ref(app_ref)
+            except Exception:
+                pass
+            self._activate_app_ref(app_ref)
+            self._wait_for_activation(chosen.pid, app=app_ref)
+            if need_move:
+                pending_moves.append(
+                    (chosen.pid, wx, wy, ww, wh, w.window_title or None)
+                )
+            if w.is_minimized:
+                self._minimize_window(chosen.pid, False)
+        self.window_restored.emit(w.app_name, w.window_title)
 
+    def _restore_launched_window(self, w, chosen: WindowInfo) -> None:
+        """Place the first window of a just-launched app
+
+        Launched windows move immediately rather than joining the batch:
+        the geometry needs to land while the new window is frontmost,
+        not after every remaining app has launched.
+        """
+        app_ref = self._find_app_by_pid(chosen.pid) or self._find_app_by_name_or_bundle(
+            w.app_name, w.bundle_id
+        )
+        try:
+            self._unhide_app_by_ref(app_ref)
+        except Exception:
+            pass
+        self._activate_app_ref(app_ref)
+        self._wait_for_activation(chosen.pid, app=app_ref)
+        self._move_window(chosen.pid, w.x, w.y, w.width, w.height, w.window_title or None)
+        if w.is_minimized:
+            self._minimize_window(chosen.pid, False)
+        self.window_restored.emit(w.app_name, w.window_title)
+
+    def _layout_is_noop(self, snapshot, current_by_app, current_by_title) -> bool:
+        """True when every snapshot window already matches the desktop
+
+        Checked against the same candidate selection the restore loop
+        would make; any missing window, geometry drift beyond tolerance,
+        pending unminimize or hidden app means real work remains.
+        """
+        for w in snapshot.windows:
+            if w.is_minimized:
+                return False
+            chosen = current_by_title.get((w.app_name, w.window_title))
+            if chosen is None:
+                candidates = current_by_app.get(w.app_name)
+                if not candidates:
+                    return False
+                chosen = candidates[0]
+            if self._geometry_differs(chosen, w):
+                return False
+            app = self._find_app_by_pid(chosen.pid)
+            try:
+                if app is None or app.isHidden():
+                    return False
+            except Exception:
+                return False
+        return True
+
+    def restore_layout(self, snapshot) -> bool:
+        try:
             current = self.get_windows()
+            # Group once by app so each profile window is an O(1) dict
+            # lookup instead of a scan over every captured window
+            current_by_app: dict[str, list[WindowInfo]] = {}
+            # First window per (app, title) pair; exact-title matches
+            # become one dict probe instead of a scan over candidates
+            current_by_title: dict[tuple[str, str], WindowInfo] = {}
+            for cw in current:
+                current_by_app.setdefault(cw.app_name, []).append(cw)
+                current_by_title.setdefault((cw.app_name, cw.window_title), cw)
+            # One visibility pass: hide apps outside the profile, unhide
+            # the pids this restore is about to touch
+            # Re-restoring the current layout is common during tuning;
+            # when nothing would change, skip the visibility pass and
+            # the whole per-window dance
+            if self._layout_is_noop(snapshot, current_by_app, current_by_title):
+                for w in snapshot.windows:
+                    self.window_restore_started.emit(w.app_name, w.window_title)
+                    self.window_restored.emit(w.app_name, w.window_title)
+                return True
+            keep_pids = {
+                cw.pid
+                for w in snapshot.windows
+                for cw in current_by_app.get(w.app_name, ())
+            }
+            self._apply_profile_visibility(snapshot, keep_pids)
             ok = True
+            # Moves for already-present windows are collected and sent as
+            # one System Events script after the loop; per-window scripts
+            # paid a full AppleScript round-trip each
+            pending_moves: list[tuple[int, int, int, int, int, str | None]] = []
             for w in snapshot.windows:
                 self.window_restore_started.emit(w.app_name, w.window_title)
-                candidates = [cw for cw in current if cw.app_name == w.app_name]
+                candidates = current_by_app.get(w.app_name, ())
                 chosen = None
                 if candidates:
-                    exact = [cw for cw in candidates if cw.window_title == w.window_title]
-                    chosen = exact[0] if exact else candidates[0]
-                    # Ensure app is visible
-                    try:
-                        apps = self.workspace.runningApplications()
-                        for app in apps:
-                            if app.processIdentifier() == chosen.pid:
-                                self._unhide_app_by_ref(app)
-                                break
-                    except Exception:
-                        pass
-                    self._activate_app(chosen.pid)
-                    time.sleep(0.1)
-                    need_move = (
-                        abs(chosen.x - w.x) > 2
-                        or abs(chosen.y - w.y) > 2
-                        or abs(chosen.width - w.width) > 2
-                        or abs(chosen.height - w.height) > 2
+                    chosen = (
+                        current_by_title.get((w.app_name, w.window_title))
+                        or candidates[0]
                     )
-                    if need_move:
-                        self._move_window(
-                            chosen.pid,
-                            w.x,
-                            w.y,
-                            w.width,
-                            w.height,
-                            w.window_title or None,
-                        )
-                    if w.is_minimized:
-                        self._minimize_window(chosen.pid, False)
-                    self.window_restored.emit(w.app_name, w.window_title)
+                    self._restore_present_window(w, chosen, pending_moves)
                 else:
                     launched, launch_cmd = self.launch_app_prefer_info(w.app_name, w.bundle_id)
                     if not launched:
                         ok = False
                         try:
                             self.window_restore_failed.emit(w.app_name, w.window_title, "launch_failed")
-                        except Exception:
+                        except RuntimeError:
                             pass
                         continue
-                    chosen = None
-                    # Wait for window to appear (progressive backoff up to ~30s)
-                    for i in range(200):
-                        time.sleep(0.15 if i < 100 else 0.3)
-                        current = self.get_windows(w.app_name)
-                        if current:
-                            chosen = current[0]
-                            break
+                    # Wait for the first window: event-driven when the
+                    # AX bridge cooperates, polling otherwise
+                    chosen = self._wait_for_app_window(w.app_name)
                     if not chosen:
                         ok = False
                         try:
                             self.window_restore_failed.emit(w.app_name, w.window_title, "window_timeout")
-                        except Exception:
+                        except RuntimeError:
                             pass
                         continue
-                    # Unhide and activate newly launched app
-                    try:
-                        apps = self.workspace.runningApplications()
-                        for app in apps:
-                            if app.localizedName() == w.app_name or (w.bundle_id and app.bundleIdentifier() == w.bundle_id):
-                                self._unhide_app_by_ref(app)
-                                break
-                    except Exception:
-                        pass
-                    self._activate_app(chosen.pid)
-                    time.sleep(0.1)
-                    self._move_window(
-                        chosen.pid,
-                        w.x,
-                        w.y,
-                        w.width,
-                        w.height,
-                        w.window_title or None,
-                    )
-                    if w.is_minimized:
-                        self._minimize_window(chosen.pid, False)
-                    self.window_restored.emit(w.app_name, w.window_title)
+                    self._restore_launched_window(w, chosen)
+            self._batch_move_windows(pending_moves)
             return ok
         except Exception as e:
-            print(f"Error restoring layout: {e}")
+            log.warning("Error restoring layout: %s", e)
             return False
 
     def restore_layout_with_report(self, snapshot) -> tuple[bool, list[dict[str, Any]]]:
         try:
-            # Hide irrelevant apps first
-            self._hide_non_profile_apps(snapshot)
-
             current = self.get_windows()
+            # Group once by app so each profile window is an O(1) dict
+            # lookup instead of a scan over every captured window
+            current_by_app: dict[str, list[WindowInfo]] = {}
+            # First window per (app, title) pair; exact-title matches
+            # become one dict probe instead of a scan over candidates
+            current_by_title: dict[tuple[str, str], WindowInfo] = {}
+            for cw in current:
+                current_by_app.setdefault(cw.app_name, []).append(cw)
+                current_by_title.setdefault((cw.app_name, cw.window_title), cw)
+            # One visibility pass: hide apps outside the profile, unhide
+            # the pids this restore is about to touch
+            # Same early exit as restore_layout, with a fully-restored
+            # report for each window
+            if self._layout_is_noop(snapshot, current_by_app, current_by_title):
+                items = []
+                for w in snapshot.windows:
+                    self.window_restore_started.emit(w.app_name, w.window_title)
+                    self.window_restored.emit(w.app_name, w.window_title)
+                    items.append(
+                        {
+                            "app_name": w.app_name,
+                            "window_title": w.window_title,
+                            "restored": True,
+                            "launched": False,
+                            "reason": None,
+                        }
+                    )
+                return True, items
+            keep_pids = {
+                cw.pid
+                for w in snapshot.windows
+                for cw in current_by_app.get(w.app_name, ())
+            }
+            self._apply_profile_visibility(snapshot, keep_pids)
             ok = True
             items: list[dict[str, Any]] = []
+            pending_moves: list[tuple[int, int, int, int, int, str | None]] = []
             for w in snapshot.windows:
                 self.window_restore_started.emit(w.app_name, w.window_title)
                 entry = {
@@ -783,40 +1608,14 @@ class WindowManager(QObject):
                     "launched": False,
                     "reason": None,
                 }
-                candidates = [cw for cw in current if cw.app_name == w.app_name]
+                candidates = current_by_app.get(w.app_name, ())
                 chosen = None
                 if candidates:
-                    exact = [cw for cw in candidates if cw.window_title == w.window_title]
-                    chosen = exact[0] if exact else candidates[0]
-                    # Ensure visibility
-                    try:
-                        apps = self.workspace.runningApplications()
-                        for app in apps:
-                            if app.processIdentifier() == chosen.pid:
-                                self._unhide_app_by_ref(app)
-                                break
-                    except Exception:
-                        pass
-                    self._activate_app(chosen.pid)
-                    time.sleep(0.1)
-                    need_move = (
-                        abs(chosen.x - w.x) > 2
-                        or abs(chosen.y - w.y) > 2
-                        or abs(chosen.width - w.width) > 2
-                        or abs(chosen.height - w.height) > 2
+                    chosen = (
+                        current_by_title.get((w.app_name, w.window_title))
+                        or candidates[0]
                     )
-                    if need_move:
-                        self._move_window(
-                            chosen.pid,
-                            w.x,
-                            w.y,
-                            w.width,
-                            w.height,
-                            w.window_title or None,
-                        )
-                    if w.is_minimized:
-                        self._minimize_window(chosen.pid, False)
-                    self.window_restored.emit(w.app_name, w.window_title)
+                    self._restore_present_window(w, chosen, pending_moves)
                     entry["restored"] = True
                 else:
                     launched, launch_cmd = self.launch_app_prefer_info(w.app_name, w.bundle_id)
@@ -827,52 +1626,27 @@ class WindowManager(QObject):
                         entry["reason"] = "launch_failed"
                         try:
                             self.window_restore_failed.emit(w.app_name, w.window_title, "launch_failed")
-                        except Exception:
+                        except RuntimeError:
                             pass
                         items.append(entry)
                         continue
-                    chosen = None
-                    # Wait for window to appear (progressive backoff up to ~30s)
-                    for i in range(200):
-                        time.sleep(0.15 if i < 100 else 0.3)
-                        current = self.get_windows(w.app_name)
-                        if current:
-                            chosen = current[0]
-                            break
+                    # Wait for the first window: event-driven when the
+                    # AX bridge cooperates, polling otherwise
+                    chosen = self._wait_for_app_window(w.app_name)
                     if not chosen:
                         ok = False
                         entry["reason"] = "window_timeout"
                         try:
                             self.window_restore_failed.emit(w.app_name, w.window_title, "window_timeout")
-                        except Exception:
+                        except RuntimeError:
                             pass
                         items.append(entry)
                         continue
-                    # Ensure visibility of launched app
-                    try:
-                        apps = self.workspace.runningApplications()
-                        for app in apps:
-                            if app.localizedName() == w.app_name or (w.bundle_id and app.bundleIdentifier() == w.bundle_id):
-                                self._unhide_app_by_ref(app)
-                                break
-                    except Exception:
-                        pass
-                    self._activate_app(chosen.pid)
-                    time.sleep(0.1)
-                    self._move_window(
-                        chosen.pid,
-                        w.x,
-                        w.y,
-                        w.width,
-                        w.height,
-                        w.window_title or None,
-                    )
-                    if w.is_minimized:
-                        self._minimize_window(chosen.pid, False)
-                    self.window_restored.emit(w.app_name, w.window_title)
+                    self._restore_launched_window(w, chosen)
                     entry["restored"] = True
                 items.append(entry)
+            self._batch_move_windows(pending_moves)
             return ok, items
         except Exception as e:
-            print(f"Error restoring layout: {e}")
+            log.warning("Error restoring layout: %s", e)
             return False, []